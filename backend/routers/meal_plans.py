@@ -4,7 +4,7 @@ Meal plan management endpoints
 
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
@@ -58,41 +58,15 @@ class MealPlanRequest(BaseModel):
     }
 
 
-@router.post("/validate")
-async def validate_meal_plan(meal_plan: MealPlanRequest):
+def find_meal_plan_errors(
+    meal_plan: MealPlanRequest, available_meal_ids: Set[str], available_people: Set[str], loc: Localizer
+) -> List[str]:
     """
-    Validate a meal plan without saving.
-
-    Checks:
-    - Meal IDs exist in database
-    - Each person has eating dates
-    - For meal prep (1 cooking date): eating dates >= cooking date
-    - For multiple cooking dates: eating dates must be in cooking dates
-    - Scheduled meal IDs in shopping trips are valid
+    Check a meal plan against the known meal IDs and people.
+    Returns localized error messages; an empty list means the plan is valid.
     """
     errors = []
 
-    # Get language from request
-    loc = Localizer(meal_plan.language)
-
-    # Load meals database to validate meal_ids
-    try:
-        meals_db = load_meals_database()
-        available_meal_ids = {meal["meal_id"] for meal in meals_db.get("meals", [])}
-    except Exception as e:
-        logger.error(f"Failed to load meals database during validation: {e}", exc_info=True)
-        errors.append(f"Failed to load meals database: {str(e)}")
-        return {"valid": False, "errors": errors}
-
-    # Get config to validate people
-    try:
-        config = get_config()
-        available_people = set(config.diet_profiles.keys())
-    except Exception as e:
-        logger.error(f"Failed to load config during validation: {e}", exc_info=True)
-        errors.append(f"Failed to load config: {str(e)}")
-        return {"valid": False, "errors": errors}
-
     # Check for unknown people in meal plan
     unknown_people = set()
     for meal in meal_plan.scheduled_meals:
@@ -167,4 +141,44 @@ async def validate_meal_plan(meal_plan: MealPlanRequest):
                     f"{trip_label}: {loc.t('error_scheduled_meal_not_found', scheduled_meal_id=scheduled_meal_id)}"
                 )
 
+    return errors
+
+
+@router.post("/validate")
+async def validate_meal_plan(meal_plan: MealPlanRequest):
+    """
+    Validate a meal plan without saving.
+
+    Checks:
+    - Meal IDs exist in database
+    - Each person has eating dates
+    - For meal prep (1 cooking date): eating dates >= cooking date
+    - For multiple cooking dates: eating dates must be in cooking dates
+    - Scheduled meal IDs in shopping trips are valid
+    """
+    errors = []
+
+    # Get language from request
+    loc = Localizer(meal_plan.language)
+
+    # Load meals database to validate meal_ids
+    try:
+        meals_db = load_meals_database()
+        available_meal_ids = {meal["meal_id"] for meal in meals_db.get("meals", [])}
+    except Exception as e:
+        logger.error(f"Failed to load meals database during validation: {e}", exc_info=True)
+        errors.append(f"Failed to load meals database: {str(e)}")
+        return {"valid": False, "errors": errors}
+
+    # Get config to validate people
+    try:
+        config = get_config()
+        available_people = set(config.diet_profiles.keys())
+    except Exception as e:
+        logger.error(f"Failed to load config during validation: {e}", exc_info=True)
+        errors.append(f"Failed to load config: {str(e)}")
+        return {"valid": False, "errors": errors}
+
+    errors = find_meal_plan_errors(meal_plan, available_meal_ids, available_people, loc)
+
     return {"valid": len(errors) == 0, "errors": errors}
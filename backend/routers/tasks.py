@@ -9,6 +9,7 @@ import sys
 from typing import Dict, List, Optional
 
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
@@ -257,9 +258,9 @@ async def generate_tasks(request: TaskGenerationRequest):
         # Initialize Todoist adapter with resolved token
         adapter = TodoistAdapter(todoist_token, config)
 
-        # Create tasks in Todoist
+        # Create tasks in Todoist - one blocking request per task, so keep it off the event loop
         logger.info(f"Creating {len(all_tasks)} tasks in Todoist")
-        created_tasks = adapter.create_tasks(all_tasks)
+        created_tasks = await run_in_threadpool(adapter.create_tasks, all_tasks)
 
         # Handle case where create_tasks returns None
         task_count = len(created_tasks) if created_tasks else len(all_tasks)
@@ -17,7 +17,7 @@ import sys
 
 from recipier.config import TaskConfig
 from recipier.meal_planner import MealPlanner
-from recipier.todoist_adapter import TodoistAdapter
+from recipier.todoist_adapter import TodoistAdapter, configure_cli_logging
 
 
 def main():
@@ -28,6 +28,9 @@ def main():
 
     args = parser.parse_args()
 
+    # Show the Todoist adapter's progress messages alongside this script's output
+    configure_cli_logging()
+
     # Get API token from environment
     api_token = os.getenv("TODOIST_API_TOKEN")
     if not api_token:
@@ -14,7 +14,7 @@ from questionary import Choice
 from recipier.config import TaskConfig
 from recipier.localization import Localizer, get_localizer
 from recipier.meal_planner import MealPlanner
-from recipier.todoist_adapter import TodoistAdapter
+from recipier.todoist_adapter import TodoistAdapter, configure_cli_logging
 
 
 def validate_date(date_str: str) -> bool:
@@ -327,6 +327,9 @@ def main():
     )
     args = parser.parse_args()
 
+    # Show the Todoist adapter's progress messages alongside this script's output
+    configure_cli_logging()
+
     # Load configuration
     config_path = args.config or "my_config.json"
     if os.path.exists(config_path):
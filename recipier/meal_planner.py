@@ -5,17 +5,25 @@ Can be used by CLI, MCP server, or web interface.
 
 import json
 import math
-from collections import defaultdict
-from dataclasses import dataclass, field
+import re
+import sys
+from collections import Counter, defaultdict
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from recipier.config import TaskConfig
 from recipier.localization import Localizer, get_localizer
-from recipier.rounding_warnings import generate_rounding_warning
+from recipier.rounding_warnings import generate_rounding_warning, meal_portions, needs_rounding_warning
 
+# Splits comma-separated suggested seasonings, consuming the whitespace around each comma
+_SEASONING_SPLIT = re.compile(r"\s*,\s*")
 
-@dataclass
+# Shared immutable default for Task labels/subtasks - most subtasks have neither, so don't allocate lists
+_EMPTY: tuple = ()
+
+
+@dataclass(slots=True)
 class Task:
     """Represents a task to be created."""
 
@@ -24,12 +32,59 @@ class Task:
     priority: int
     assigned_to: str
     due_date: Optional[str] = None
-    labels: List[str] = field(default_factory=list)
-    subtasks: List["Task"] = field(default_factory=list)
+    labels: Sequence[str] = _EMPTY  # Replace rather than append - the default is a shared empty tuple
+    subtasks: Sequence["Task"] = _EMPTY
     meal_id: Optional[str] = None
     task_type: str = "other"  # shopping, prep, cooking
 
 
+def _allocate_units(total_units: int, unit_size: float, needs: List[float]) -> List[int]:
+    """
+    Allocate whole units to consecutive trips' needs, carrying leftovers forward.
+    Units are bought only when leftovers don't cover a trip; the last trip takes the remainder of total_units.
+    """
+    allocated_units = []
+    leftover = 0.0  # Track leftover from previous trips (in quantity, not units)
+
+    for need in needs[:-1]:
+        if leftover >= need:
+            # Have enough from leftovers, buy nothing
+            allocated_units.append(0)
+            leftover -= need
+        else:
+            # Need more, calculate deficit and buy enough units
+            units_to_buy = math.ceil((need - leftover) / unit_size)
+            allocated_units.append(units_to_buy)
+            leftover = leftover + units_to_buy * unit_size - need
+
+    # Last trip: adjust to match total exactly
+    allocated_units.append(total_units - sum(allocated_units))
+    return allocated_units
+
+
+def _proportional_shares(total: float, quantities: List[float], quantities_total: float) -> List[int]:
+    """Split total in proportion to quantities (which sum to quantities_total), rounding each share."""
+    if quantities_total <= 0:
+        return [0] * len(quantities)
+    if type(total) is not int or type(quantities_total) is not int:
+        return [round(total * (qty / quantities_total)) for qty in quantities]
+
+    # All-integer inputs (the usual case): round(total * qty / quantities_total) with integer arithmetic.
+    # Exact, so ties go to even like round() instead of depending on float error in qty / quantities_total.
+    half = quantities_total >> 1
+    even_total = not quantities_total & 1
+    shares = []
+    for qty in quantities:
+        if type(qty) is not int:
+            shares.append(round(total * (qty / quantities_total)))
+            continue
+        share, remainder = divmod(total * qty + half, quantities_total)
+        if even_total and not remainder and share & 1:
+            share -= 1  # Exact .5 rounded up to an odd share; round half to even instead
+        shares.append(share)
+    return shares
+
+
 class MealPlanner:
     """Core meal planning logic."""
 
@@ -56,6 +111,21 @@ class MealPlanner:
 
         return data
 
+    @property
+    def ingredient_details(self) -> Dict[str, Any]:
+        """Per-ingredient details (nutrition, unit sizes, display units) from the meals database."""
+        return self._ingredient_details
+
+    @ingredient_details.setter
+    def ingredient_details(self, details: Dict[str, Any]) -> None:
+        self._ingredient_details = details
+        # Precompute display conversions (e.g. eggs: grams -> pieces) so lookups are a single dict get
+        self._display_conv = {
+            name: (d["grams_per_unit"], d["display_unit"])
+            for name, d in details.items()
+            if d and d.get("display_unit") and d.get("grams_per_unit")
+        }
+
     def load_meal_plan(self, plan_path: str, meals_db_path: str) -> Dict[str, Any]:
         """Load meal plan and expand with meals database."""
         # Load meal plan
@@ -130,7 +200,9 @@ class MealPlanner:
                         }
 
                 ingredient = {
-                    "name": base_ing["name"],
+                    # Interned so every meal shares one string object per ingredient, letting the many
+                    # name-keyed lookups (aggregation, indexes, warnings) short-circuit on identity
+                    "name": sys.intern(base_ing["name"]),
                     "quantity": round(total_qty),
                     "unit": base_ing["unit"],
                     "category": base_ing["category"],
@@ -167,12 +239,8 @@ class MealPlanner:
 
             # Handle prep tasks
             if "prep_tasks" in recipe:
-                prep_tasks = []
-                for prep in recipe["prep_tasks"]:
-                    prep_task = prep.copy()
-                    prep_task["assigned_to"] = scheduled.get("prep_assigned_to", scheduled["assigned_cook"])
-                    prep_tasks.append(prep_task)
-                expanded_meal["prep_tasks"] = prep_tasks
+                prep_assignee = scheduled.get("prep_assigned_to", scheduled["assigned_cook"])
+                expanded_meal["prep_tasks"] = [{**prep, "assigned_to": prep_assignee} for prep in recipe["prep_tasks"]]
 
             expanded_meals.append(expanded_meal)
 
@@ -196,12 +264,11 @@ class MealPlanner:
         Returns:
             tuple: (converted_quantity, display_unit)
         """
-        details = self.ingredient_details.get(ingredient_name)
-
         # Check if ingredient has display_unit conversion (like eggs -> szt.)
-        if details and details.get("display_unit") and details.get("grams_per_unit") and unit == "g":
-            converted_qty = round(quantity / details["grams_per_unit"])
-            return (converted_qty, details["display_unit"])
+        conv = self._display_conv.get(ingredient_name)
+        if conv is not None and unit == "g":
+            grams_per_unit, display_unit = conv
+            return (round(quantity / grams_per_unit), display_unit)
 
         # Return original quantity and unit
         return (quantity, unit)
@@ -237,32 +304,34 @@ class MealPlanner:
 
         return by_category
 
+    def sort_ingredients_by_category(self, ingredients: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Order ingredients by configured category, then by name, in a single sort.
+        Ingredients whose category is not in shopping_categories are dropped.
+        """
+        category_order = {category: i for i, category in enumerate(self.config.shopping_categories)}
+        known = [ing for ing in ingredients if ing.get("category", "other") in category_order]
+        return sorted(known, key=lambda ing: (category_order[ing.get("category", "other")], ing["name"]))
+
     def create_ingredient_subtasks(self, ingredients: List[Dict[str, Any]]) -> List[Task]:
         """Create subtasks for ingredients, ordered by category."""
         subtasks = []
-        by_category = self.group_ingredients_by_category(ingredients)
-
-        # Process in category order
-        for category in self.config.shopping_categories:
-            if category not in by_category:
-                continue
-
-            # Sort ingredients within category by name
-            sorted_ingredients = sorted(by_category[category], key=lambda x: x["name"])
 
-            for ing in sorted_ingredients:
-                title = self.format_ingredient_title(ing)
-                # Use localized category label
-                labels = [self.loc.get_category_label(category)] if self.config.use_ingredient_category_labels else []
-
-                subtask = Task(
-                    title=title,
-                    description="",  # Notes are in the title
-                    priority=4,  # Low priority for subtasks
-                    assigned_to="",  # Inherited from parent
-                    labels=labels,
-                )
-                subtasks.append(subtask)
+        # Process in category order, sorted by name within each category
+        for ing in self.sort_ingredients_by_category(ingredients):
+            title = self.format_ingredient_title(ing)
+            # Use localized category label
+            category = ing.get("category", "other")
+            labels = [self.loc.get_category_label(category)] if self.config.use_ingredient_category_labels else _EMPTY
+
+            subtask = Task(
+                title=title,
+                description="",  # Notes are in the title
+                priority=4,  # Low priority for subtasks
+                assigned_to="",  # Inherited from parent
+                labels=labels,
+            )
+            subtasks.append(subtask)
 
         return subtasks
 
@@ -277,42 +346,25 @@ class MealPlanner:
             Dictionary with profile names as keys and calorie counts as values
             e.g., {"high_calorie": 2850, "low_calorie": 1700}
         """
-        if not meal or "ingredients" not in meal or not self.ingredient_details:
-            return {}
-
-        # Collect all people from per_person data and map to diet profiles
-        people = set()
-        for ing in meal["ingredients"]:
-            if "per_person" in ing:
-                people.update(ing["per_person"].keys())
-
-        if not people:
+        if not self.ingredient_details or not meal or "ingredients" not in meal:
             return {}
 
-        # Map people to their diet profiles
+        # Single pass: accumulate calories and discover profiles as people appear in per_person data
         profile_totals = {}
-        for person in people:
-            profile = self.config.diet_profiles.get(person, person)
-            if profile not in profile_totals:
-                profile_totals[profile] = 0.0
-
-        # Calculate calories for each ingredient
         for ing in meal["ingredients"]:
-            ingredient_name = ing["name"]
-            details = self.ingredient_details.get(ingredient_name, {})
-            calories_per_100g = details.get("calories_per_100g", 0)
-
-            if "per_person" not in ing:
+            per_person = ing.get("per_person")
+            if not per_person:
                 continue
 
+            details = self.ingredient_details.get(ing["name"], {})
+            calories_per_100g = details.get("calories_per_100g", 0)
+
             # Add calories for each person (mapped to their profile)
-            for person in people:
-                if person in ing["per_person"]:
-                    profile = self.config.diet_profiles.get(person, person)
-                    quantity = ing["per_person"][person]["quantity"]
-                    # Calculate calories: (quantity / 100) * calories_per_100g
-                    calories = (quantity / 100.0) * calories_per_100g
-                    profile_totals[profile] += calories
+            for person, person_data in per_person.items():
+                profile = self.config.diet_profiles.get(person, person)
+                # Calculate calories: (quantity / 100) * calories_per_100g
+                calories = (person_data["quantity"] / 100.0) * calories_per_100g
+                profile_totals[profile] = profile_totals.get(profile, 0.0) + calories
 
         # Round all totals to integers
         return {profile: round(total) for profile, total in profile_totals.items()}
@@ -334,31 +386,14 @@ class MealPlanner:
         if not meal or "ingredients" not in meal or not self.ingredient_details:
             return {}
 
-        # Collect all people from per_person data and map to diet profiles
-        people = set()
-        for ing in meal["ingredients"]:
-            if "per_person" in ing:
-                people.update(ing["per_person"].keys())
-
-        if not people:
-            return {}
-
-        # Initialize nutrition totals for each profile
+        # Single pass: accumulate nutrition and discover profiles as people appear in per_person data
         profile_nutrition = {}
-        for person in people:
-            profile = self.config.diet_profiles.get(person, person)
-            if profile not in profile_nutrition:
-                profile_nutrition[profile] = {
-                    "calories": 0.0,
-                    "fat": 0.0,
-                    "protein": 0.0,
-                    "carbs": 0.0,
-                }
-
-        # Calculate nutrition for each ingredient
         for ing in meal["ingredients"]:
-            ingredient_name = ing["name"]
-            details = self.ingredient_details.get(ingredient_name, {})
+            per_person = ing.get("per_person")
+            if not per_person:
+                continue
+
+            details = self.ingredient_details.get(ing["name"], {})
 
             # Get nutrition values per 100g (default to 0 if not present)
             calories_per_100g = details.get("calories_per_100g", 0)
@@ -366,20 +401,19 @@ class MealPlanner:
             protein_per_100g = details.get("protein_per_100g", 0)
             carbs_per_100g = details.get("carbs_per_100g", 0)
 
-            if "per_person" not in ing:
-                continue
-
             # Add nutrition for each person (mapped to their profile)
-            for person in people:
-                if person in ing["per_person"]:
-                    profile = self.config.diet_profiles.get(person, person)
-                    quantity = ing["per_person"][person]["quantity"]
-
-                    # Calculate nutrition: (quantity / 100) * nutrition_per_100g
-                    profile_nutrition[profile]["calories"] += (quantity / 100.0) * calories_per_100g
-                    profile_nutrition[profile]["fat"] += (quantity / 100.0) * fat_per_100g
-                    profile_nutrition[profile]["protein"] += (quantity / 100.0) * protein_per_100g
-                    profile_nutrition[profile]["carbs"] += (quantity / 100.0) * carbs_per_100g
+            for person, person_data in per_person.items():
+                profile = self.config.diet_profiles.get(person, person)
+                totals = profile_nutrition.get(profile)
+                if totals is None:
+                    totals = profile_nutrition[profile] = {"calories": 0.0, "fat": 0.0, "protein": 0.0, "carbs": 0.0}
+
+                # Calculate nutrition: (quantity / 100) * nutrition_per_100g
+                quantity = person_data["quantity"]
+                totals["calories"] += (quantity / 100.0) * calories_per_100g
+                totals["fat"] += (quantity / 100.0) * fat_per_100g
+                totals["protein"] += (quantity / 100.0) * protein_per_100g
+                totals["carbs"] += (quantity / 100.0) * carbs_per_100g
 
         # Round all nutrition values
         for profile in profile_nutrition:
@@ -424,52 +458,44 @@ class MealPlanner:
             self.round_and_distribute_ingredients(expanded_plan)
 
         # Step 3: Calculate nutrition for each scheduled meal
-        nutrition_by_meal = {}
-
-        for meal in expanded_plan.get("meals", []):
-            meal_id = meal.get("id")
-            if meal_id:
-                nutrition_by_meal[meal_id] = self.calculate_meal_nutrition(meal)
+        return {
+            meal["id"]: self.calculate_meal_nutrition(meal) for meal in expanded_plan.get("meals", []) if meal.get("id")
+        }
 
-        return nutrition_by_meal
+    def create_person_portion_subtasks(self, ingredients: List[Dict[str, Any]], presorted: bool = False) -> List[Task]:
+        """
+        Create per-person portion subtasks for cooking tasks, organized by ingredient.
 
-    def create_person_portion_subtasks(self, ingredients: List[Dict[str, Any]]) -> List[Task]:
-        """Create per-person portion subtasks for cooking tasks, organized by ingredient."""
+        Pass presorted=True when ingredients already come from sort_ingredients_by_category().
+        """
         subtasks = []
-
-        # Group ingredients by category for ordered processing
-        by_category = self.group_ingredients_by_category(ingredients)
+        if not presorted:
+            ingredients = self.sort_ingredients_by_category(ingredients)
 
         # Process ingredients in category order, creating a subtask for each ingredient-person combination
-        for category in self.config.shopping_categories:
-            if category not in by_category:
+        for ing in ingredients:
+            # Check if there's per_person data
+            if "per_person" not in ing:
                 continue
 
-            sorted_ingredients = sorted(by_category[category], key=lambda x: x["name"])
+            # Create a subtask for each person for this ingredient
+            for person in sorted(ing["per_person"].keys()):
+                person_portion = ing["per_person"][person]
+                quantity = person_portion["quantity"]
+                unit = person_portion["unit"]
 
-            for ing in sorted_ingredients:
-                # Check if there's per_person data
-                if "per_person" not in ing:
-                    continue
+                # Convert to display format if needed (e.g., eggs: grams -> pieces)
+                display_qty, display_unit = self.convert_ingredient_for_display(ing["name"], quantity, unit)
 
-                # Create a subtask for each person for this ingredient
-                for person in sorted(ing["per_person"].keys()):
-                    person_portion = ing["per_person"][person]
-                    quantity = person_portion["quantity"]
-                    unit = person_portion["unit"]
-
-                    # Convert to display format if needed (e.g., eggs: grams -> pieces)
-                    display_qty, display_unit = self.convert_ingredient_for_display(ing["name"], quantity, unit)
-
-                    # Create subtask: "2 szt. Jajka" or "240g Ryż" with person as label
-                    subtask = Task(
-                        title=f"{display_qty}{display_unit} {ing['name']}",
-                        description="",
-                        priority=4,
-                        assigned_to="",
-                        labels=[person],  # Add person as label for filtering
-                    )
-                    subtasks.append(subtask)
+                # Create subtask: "2 szt. Jajka" or "240g Ryż" with person as label
+                subtask = Task(
+                    title=f"{display_qty}{display_unit} {ing['name']}",
+                    description="",
+                    priority=4,
+                    assigned_to="",
+                    labels=[person],  # Add person as label for filtering
+                )
+                subtasks.append(subtask)
 
         return subtasks
 
@@ -483,6 +509,16 @@ class MealPlanner:
             - aggregated: Dict[ingredient_name, {total_qty, unit, category, per_person_totals, notes}]
             - trip_needs: Dict[ingredient_name, List[(trip_index, quantity_needed)]]
         """
+        aggregated, trip_needs, _ = self._aggregate_trip_ingredients(meal_plan)
+        return aggregated, trip_needs
+
+    def _aggregate_trip_ingredients(
+        self, meal_plan: Dict[str, Any]
+    ) -> tuple[Dict[str, Dict[str, Any]], Dict[str, List[tuple[int, float]]], List[Dict[str, Dict[str, Any]]]]:
+        """
+        Same as aggregate_ingredients_across_trips, also returning each trip's per-ingredient sums
+        ({ingredient_name: {quantity, unit, category, per_person, notes}}, in trip order).
+        """
         aggregated = {}
         trip_needs = defaultdict(list)
         meals_by_id = {meal["id"]: meal for meal in meal_plan["meals"]}
@@ -494,6 +530,7 @@ class MealPlanner:
             all_meal_ids = [meal["id"] for meal in meal_plan["meals"]]
             shopping_trips = [{"scheduled_meal_ids": all_meal_ids}]
 
+        trip_entries = []
         for trip_index, trip in enumerate(shopping_trips):
             # Collect ingredients for this trip
             trip_ingredients = defaultdict(
@@ -514,20 +551,25 @@ class MealPlanner:
                     continue
 
                 for ing in meal["ingredients"]:
-                    name = ing["name"]
-                    trip_ingredients[name]["quantity"] += ing["quantity"]
-                    trip_ingredients[name]["unit"] = ing["unit"]
-                    trip_ingredients[name]["category"] = ing["category"]
-                    trip_ingredients[name]["notes"] = ing.get("notes")
+                    # Bind the trip entry once rather than re-indexing it for every field
+                    entry = trip_ingredients[ing["name"]]
+                    entry["quantity"] += ing["quantity"]
+                    entry["unit"] = ing["unit"]
+                    entry["category"] = ing["category"]
+                    entry["notes"] = ing.get("notes")
 
                     # Aggregate per_person data
+                    entry_per_person = entry["per_person"]
                     for person, person_data in ing.get("per_person", {}).items():
-                        trip_ingredients[name]["per_person"][person]["quantity"] += person_data["quantity"]
-                        trip_ingredients[name]["per_person"][person]["original_quantity"] += person_data.get(
+                        person_totals = entry_per_person[person]
+                        person_totals["quantity"] += person_data["quantity"]
+                        person_totals["original_quantity"] += person_data.get(
                             "original_quantity", person_data["quantity"]
                         )
-                        trip_ingredients[name]["per_person"][person]["unit"] = person_data["unit"]
-                        trip_ingredients[name]["per_person"][person]["portions"] += person_data["portions"]
+                        person_totals["unit"] = person_data["unit"]
+                        person_totals["portions"] += person_data["portions"]
+
+            trip_entries.append(trip_ingredients)
 
             # Store trip needs and add to totals
             for name, data in trip_ingredients.items():
@@ -559,7 +601,7 @@ class MealPlanner:
                     # Add to total original quantity
                     aggregated[name]["total_original_qty"] += person_data["original_quantity"]
 
-        return aggregated, dict(trip_needs)
+        return aggregated, dict(trip_needs), trip_entries
 
     def distribute_rounded_quantity_across_trips(
         self, rounded_total: float, unit_size: float, trip_needs: List[tuple[int, float]]
@@ -577,39 +619,26 @@ class MealPlanner:
         Returns:
             List of quantities per trip (all multiples of unit_size)
         """
-        if not trip_needs:
-            return []
-
         # Sort by trip index
-        trip_needs_sorted = sorted(trip_needs, key=lambda x: x[0])
-        num_trips = len(trip_needs_sorted)
-        total_units = int(round(rounded_total / unit_size))
-
-        allocated_units = []
-        leftover = 0.0  # Track leftover from previous trips (in quantity, not units)
-
-        for i in range(num_trips - 1):
-            _, need = trip_needs_sorted[i]
-            available = leftover
+        return self._distribute_rounded_quantity_sorted(
+            rounded_total, unit_size, sorted(trip_needs, key=lambda x: x[0])
+        )
 
-            if available >= need:
-                # Have enough from leftovers, buy nothing
-                allocated_units.append(0)
-                leftover = available - need
-            else:
-                # Need more, calculate deficit and buy enough units
-                deficit = need - available
-                units_to_buy = math.ceil(deficit / unit_size)
-                allocated_units.append(units_to_buy)
-                bought = units_to_buy * unit_size
-                leftover = available + bought - need
+    def _distribute_rounded_quantity_sorted(
+        self, rounded_total: float, unit_size: float, trip_needs_sorted: List[tuple[int, float]]
+    ) -> List[float]:
+        """
+        Same as distribute_rounded_quantity_across_trips, but trip_needs must already be
+        ordered by trip index (as produced by aggregate_ingredients_across_trips).
+        """
+        if not trip_needs_sorted:
+            return []
 
-        # Last trip: adjust to match total exactly
-        last_trip_units = total_units - sum(allocated_units)
-        allocated_units.append(last_trip_units)
+        needs = [need for _, need in trip_needs_sorted]
+        total_units = int(round(rounded_total / unit_size))
 
-        # Convert back to quantities
-        return [units * unit_size for units in allocated_units]
+        # Convert allocated units back to quantities
+        return [units * unit_size for units in _allocate_units(total_units, unit_size, needs)]
 
     def compensate_calories_per_profile(
         self,
@@ -657,13 +686,21 @@ class MealPlanner:
             else:
                 adjustment_factors[profile] = 1.0
 
+        # Resolve each person's factor once rather than per (ingredient, person) pair
+        diet_profiles = self.config.diet_profiles
+        person_factors = {}
+
+        def factor_for(person: str) -> float:
+            factor = person_factors.get(person)
+            if factor is None:
+                factor = person_factors[person] = adjustment_factors.get(diet_profiles.get(person, person), 1.0)
+            return factor
+
         # Apply adjustments to aggregated per_person_totals
         for ing_name in adjustable_ingredients:
             ing_data = aggregated[ing_name]
             for person, person_data in ing_data["per_person_totals"].items():
-                diet_profile = self.config.diet_profiles.get(person, person)
-                factor = adjustment_factors.get(diet_profile, 1.0)
-                person_data["quantity"] = round(person_data["quantity"] * factor)
+                person_data["quantity"] = round(person_data["quantity"] * factor_for(person))
 
             # Recalculate total
             ing_data["total_qty"] = sum(
@@ -671,6 +708,7 @@ class MealPlanner:
             )
 
         # Apply adjustments proportionally to meal plan ingredients
+        adjustable_names = set(adjustable_ingredients)
         meals_by_id = {meal["id"]: meal for meal in meal_plan["meals"]}
 
         # Get all meals either from shopping trips or directly
@@ -686,31 +724,88 @@ class MealPlanner:
 
         for meal in meals_to_process:
             for ing in meal["ingredients"]:
-                if ing["name"] in adjustable_ingredients:
+                if ing["name"] in adjustable_names:
                     # Adjust per_person quantities
-                    for person, person_data in ing.get("per_person", {}).items():
-                        diet_profile = self.config.diet_profiles.get(person, person)
-                        factor = adjustment_factors.get(diet_profile, 1.0)
-                        person_data["quantity"] = round(person_data["quantity"] * factor)
+                    per_person = ing.get("per_person", {})
+                    for person, person_data in per_person.items():
+                        person_data["quantity"] = round(person_data["quantity"] * factor_for(person))
 
                     # Recalculate total
-                    ing["quantity"] = sum(person_data["quantity"] for person_data in ing.get("per_person", {}).values())
+                    ing["quantity"] = sum(person_data["quantity"] for person_data in per_person.values())
+
+    def _build_meal_ing_index(self, meal_plan: Dict[str, Any]) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+        """
+        Index meal plan ingredients as {scheduled_meal_id: {ingredient_name: [ingredient, ...]}}.
+
+        A meal can list the same ingredient more than once, so every entry is kept in list order and rounding
+        rescales all of them. The values are the meal plan's own ingredient dicts, so in-place updates are
+        visible through the index.
+        """
+        index = {}
+        for meal in meal_plan["meals"]:
+            ings_by_name = index[meal["id"]] = {}
+            for ing in meal["ingredients"]:
+                ings_by_name.setdefault(ing["name"], []).append(ing)
+        return index
+
+    def _build_ingredient_meal_index(
+        self, meal_plan: Dict[str, Any]
+    ) -> Dict[str, List[tuple[Dict[str, Any], Dict[str, Any], int]]]:
+        """
+        Index meal plan ingredients as {ingredient_name: [(meal, ingredient, portions), ...]} in plan order.
+
+        Unlike _build_meal_ing_index, only each meal's first entry for an ingredient is kept: rounding warnings
+        list a meal once, with the quantity of its first entry. A meal's portions (eating dates across all
+        people) are counted once here rather than per warned ingredient.
+        """
+        index = {}
+        for meal in meal_plan["meals"]:
+            portions = meal_portions(meal)
+            for ing in meal["ingredients"]:
+                uses = index.setdefault(ing["name"], [])
+                if not uses or uses[-1][0] is not meal:
+                    uses.append((meal, ing, portions))
+        return index
+
+    def _rescale_ingredient(self, ing: Dict[str, Any], new_qty: int) -> None:
+        """Set a meal ingredient's quantity, scaling its per_person quantities proportionally."""
+        original_qty = ing["quantity"]
+        ing["quantity"] = new_qty
+
+        per_person = ing.get("per_person")
+        if per_person:
+            person_data_list = list(per_person.values())
+            shares = _proportional_shares(new_qty, [pd["quantity"] for pd in person_data_list], original_qty)
+            for person_data, share in zip(person_data_list, shares):
+                person_data["quantity"] = share
 
     def round_and_distribute_ingredients(self, meal_plan: Dict[str, Any]) -> Dict[str, Any]:
         """
         Round ingredients at meal plan level, then distribute across shopping trips.
 
-        Returns: RoundingResult-like dict with ingredients_per_trip, warnings, and calorie_adjustments
+        Returns: RoundingResult-like dict with ingredients_per_trip, warnings, and calorie_adjustments,
+        plus the meals_by_id lookup built along the way
         """
         # Phase 1: Aggregate ingredients across all shopping trips (or all meals if no trips)
-        aggregated, trip_needs = self.aggregate_ingredients_across_trips(meal_plan)
+        aggregated, trip_needs, trip_entries = self._aggregate_trip_ingredients(meal_plan)
 
         warnings = []
         calorie_delta_per_profile = defaultdict(float)
 
+        # Lookups shared by all phases. Compensation only mutates quantities, so these stay valid throughout.
+        meals_by_id = {meal["id"]: meal for meal in meal_plan["meals"]}
+        has_shopping_trips = bool(meal_plan.get("shopping_trips"))
+        # Index each meal's ingredients by name once, instead of scanning ingredient lists per lookup
+        meal_ing_index = self._build_meal_ing_index(meal_plan)
+        # Scheduled meals whose quantities were rewritten; trips without any keep their Phase 1 sums
+        changed_meals = set()
+
         # Phase 2: Round quantities with unit_size and track calorie changes
         # Only perform rounding if enabled in config
         if self.config.enable_ingredient_rounding:
+            # Meals using each ingredient, so rounding warnings don't rescan the whole plan per ingredient
+            ingredient_index = self._build_ingredient_meal_index(meal_plan)
+
             for ing_name, ing_data in aggregated.items():
                 details = self.ingredient_details.get(ing_name, {})
                 unit_size = details.get("unit_size")
@@ -723,10 +818,13 @@ class MealPlanner:
                     # Round UP to nearest multiple of unit_size (based on current aggregated total)
                     rounded_total = max(unit_size, math.ceil(current_total / unit_size) * unit_size)
 
-                    # Generate warning if needed
-                    warning = generate_rounding_warning(ing_name, original_total, rounded_total, unit_size, meal_plan)
-                    if warning:
-                        warnings.append(warning)
+                    # Generate warning if needed (most ingredients stay under the threshold, so check that first)
+                    if needs_rounding_warning(original_total, rounded_total):
+                        warning = generate_rounding_warning(
+                            ing_name, original_total, rounded_total, unit_size, meal_plan, ingredient_index
+                        )
+                        if warning:
+                            warnings.append(warning)
 
                     # Calculate calorie delta per profile
                     calories_per_100 = details.get("calories_per_100g", 0)
@@ -748,100 +846,88 @@ class MealPlanner:
                     # Phase 3: Apply rounded quantities to meal plan
                     # If no shopping trips, update all meals proportionally
                     # If shopping trips exist, distribute across trips
-                    meals_by_id = {meal["id"]: meal for meal in meal_plan["meals"]}
-                    has_shopping_trips = bool(meal_plan.get("shopping_trips"))
-
                     if has_shopping_trips and ing_name in trip_needs:
                         # Distribute across shopping trips
-                        distributed_quantities = self.distribute_rounded_quantity_across_trips(
-                            rounded_total, unit_size, trip_needs[ing_name]
+                        # trip_needs are appended in trip order by aggregate_ingredients_across_trips
+                        sorted_trip_needs = trip_needs[ing_name]
+                        distributed_quantities = self._distribute_rounded_quantity_sorted(
+                            rounded_total, unit_size, sorted_trip_needs
                         )
 
                         # Store distribution for later use
                         ing_data["distributed_quantities"] = distributed_quantities
 
                         # Apply distributed quantities to meal plan
-                        sorted_trip_needs = sorted(trip_needs[ing_name], key=lambda x: x[0])
                         for (trip_index, _), dist_qty in zip(sorted_trip_needs, distributed_quantities):
                             trip = meal_plan["shopping_trips"][trip_index]
 
-                            for scheduled_meal_id in trip["scheduled_meal_ids"]:
-                                meal = meals_by_id.get(scheduled_meal_id)
-                                if not meal:
-                                    continue
-
-                                # Find the ingredient in the meal and update its quantity
-                                for ing in meal["ingredients"]:
-                                    if ing["name"] == ing_name:
-                                        # Calculate this meal's share of the distributed quantity
-                                        meal_original_qty = ing["quantity"]
-                                        trip_original_total = sum(
-                                            meals_by_id[mid]["ingredients"][j]["quantity"]
-                                            for mid in trip["scheduled_meal_ids"]
-                                            if mid in meals_by_id
-                                            for j, ing_item in enumerate(meals_by_id[mid]["ingredients"])
-                                            if ing_item["name"] == ing_name
-                                        )
-
-                                        if trip_original_total > 0:
-                                            ratio = meal_original_qty / trip_original_total
-                                            meal_new_qty = round(dist_qty * ratio)
-
-                                            # Update total quantity
-                                            ing["quantity"] = meal_new_qty
-
-                                            # Update per_person quantities proportionally
-                                            if "per_person" in ing:
-                                                for person, person_data in ing["per_person"].items():
-                                                    person_ratio = (
-                                                        person_data["quantity"] / meal_original_qty
-                                                        if meal_original_qty > 0
-                                                        else 0
-                                                    )
-                                                    person_data["quantity"] = round(meal_new_qty * person_ratio)
-                    else:
-                        # No shopping trips - update all meals proportionally
-                        for meal in meal_plan["meals"]:
-                            for ing in meal["ingredients"]:
-                                if ing["name"] == ing_name:
-                                    meal_original_qty = ing["quantity"]
-                                    if original_total > 0:
-                                        ratio = meal_original_qty / original_total
-                                        meal_new_qty = round(rounded_total * ratio)
-
-                                        # Update total quantity
-                                        ing["quantity"] = meal_new_qty
-
-                                        # Update per_person quantities proportionally
-                                        if "per_person" in ing:
-                                            for person, person_data in ing["per_person"].items():
-                                                person_ratio = (
-                                                    person_data["quantity"] / meal_original_qty
-                                                    if meal_original_qty > 0
-                                                    else 0
-                                                )
-                                                person_data["quantity"] = round(meal_new_qty * person_ratio)
+                            # Meals in this trip that use the ingredient, and their combined pre-rounding quantity
+                            trip_ings = [
+                                ing
+                                for mid in trip["scheduled_meal_ids"]
+                                for ing in meal_ing_index.get(mid, {}).get(ing_name, ())
+                            ]
+                            trip_original_total = sum(ing["quantity"] for ing in trip_ings)
+                            # Nothing to rescale if the trip already gets exactly what its meals need
+                            if trip_original_total <= 0 or dist_qty == trip_original_total:
+                                continue
+
+                            # Each meal's share of the distributed quantity, computed for the whole trip at once
+                            new_qtys = _proportional_shares(
+                                dist_qty, [ing["quantity"] for ing in trip_ings], trip_original_total
+                            )
+                            for ing, meal_new_qty in zip(trip_ings, new_qtys):
+                                self._rescale_ingredient(ing, meal_new_qty)
+                            changed_meals.update(trip["scheduled_meal_ids"])
+                    elif original_total > 0 and rounded_total != original_total:
+                        # No shopping trips - update all meals proportionally (a no-op if rounding changed nothing)
+                        meal_ings = [
+                            ing for meal in meal_plan["meals"] for ing in meal_ing_index[meal["id"]].get(ing_name, ())
+                        ]
+                        new_qtys = _proportional_shares(
+                            rounded_total, [ing["quantity"] for ing in meal_ings], original_total
+                        )
+                        for ing, meal_new_qty in zip(meal_ings, new_qtys):
+                            self._rescale_ingredient(ing, meal_new_qty)
+                        changed_meals.update(meals_by_id)
 
             # Phase 4: Compensate calories by adjusting adjustable ingredients
             if any(abs(delta) > 0.1 for delta in calorie_delta_per_profile.values()):
+                # Phase 5 reads the compensated quantities straight from the meal plan, so there is no
+                # need to re-aggregate here
                 self.compensate_calories_per_profile(aggregated, calorie_delta_per_profile, meal_plan)
-                # Recalculate aggregated after compensation
-                aggregated, trip_needs = self.aggregate_ingredients_across_trips(meal_plan)
+                changed_meals.update(meals_by_id)
 
         # Phase 5: Build ingredients_per_trip from meal plan (now with adjusted quantities)
-        meals_by_id = {meal["id"]: meal for meal in meal_plan["meals"]}
         ingredients_per_trip = []
 
-        for trip in meal_plan["shopping_trips"]:
-            trip_ingredients = defaultdict(
-                lambda: {
-                    "quantity": 0,
-                    "unit": None,
-                    "category": None,
-                    "per_person": defaultdict(lambda: {"quantity": 0, "unit": None, "portions": 0}),
-                    "notes": None,
-                }
-            )
+        for trip_index, trip in enumerate(meal_plan["shopping_trips"]):
+            if changed_meals.isdisjoint(trip["scheduled_meal_ids"]):
+                # No meal in this trip changed, so the Phase 1 sums are current; just reshape them
+                ingredients_per_trip.append(
+                    [
+                        {
+                            "name": name,
+                            "quantity": data["quantity"],
+                            "unit": data["unit"],
+                            "category": data["category"],
+                            "per_person": {
+                                person: {
+                                    "quantity": person_data["quantity"],
+                                    "unit": person_data["unit"],
+                                    "portions": person_data["portions"],
+                                }
+                                for person, person_data in data["per_person"].items()
+                            },
+                            "notes": data["notes"],
+                        }
+                        for name, data in trip_entries[trip_index].items()
+                    ]
+                )
+                continue
+
+            # Entries are created in their final list format on first sight (name -> entry keeps meal order)
+            trip_ingredients = {}
 
             for scheduled_meal_id in trip["scheduled_meal_ids"]:
                 meal = meals_by_id.get(scheduled_meal_id)
@@ -850,36 +936,38 @@ class MealPlanner:
 
                 for ing in meal["ingredients"]:
                     name = ing["name"]
-                    trip_ingredients[name]["quantity"] += ing["quantity"]
-                    trip_ingredients[name]["unit"] = ing["unit"]
-                    trip_ingredients[name]["category"] = ing["category"]
-                    trip_ingredients[name]["notes"] = ing.get("notes")
+                    entry = trip_ingredients.get(name)
+                    if entry is None:
+                        entry = trip_ingredients[name] = {
+                            "name": name,
+                            "quantity": 0,
+                            "unit": None,
+                            "category": None,
+                            "per_person": {},
+                            "notes": None,
+                        }
 
-                    for person, person_data in ing.get("per_person", {}).items():
-                        trip_ingredients[name]["per_person"][person]["quantity"] += person_data["quantity"]
-                        trip_ingredients[name]["per_person"][person]["unit"] = person_data["unit"]
-                        trip_ingredients[name]["per_person"][person]["portions"] += person_data["portions"]
+                    entry["quantity"] += ing["quantity"]
+                    entry["unit"] = ing["unit"]
+                    entry["category"] = ing["category"]
+                    entry["notes"] = ing.get("notes")
 
-            # Convert to list format
-            trip_ing_list = []
-            for name, data in trip_ingredients.items():
-                trip_ing_list.append(
-                    {
-                        "name": name,
-                        "quantity": data["quantity"],
-                        "unit": data["unit"],
-                        "category": data["category"],
-                        "per_person": dict(data["per_person"]),
-                        "notes": data["notes"],
-                    }
-                )
+                    for person, person_data in ing.get("per_person", {}).items():
+                        person_totals = entry["per_person"].get(person)
+                        if person_totals is None:
+                            person_totals = entry["per_person"][person] = {"quantity": 0, "unit": None, "portions": 0}
+                        person_totals["quantity"] += person_data["quantity"]
+                        person_totals["unit"] = person_data["unit"]
+                        person_totals["portions"] += person_data["portions"]
 
-            ingredients_per_trip.append(trip_ing_list)
+            ingredients_per_trip.append(list(trip_ingredients.values()))
 
         return {
             "ingredients_per_trip": ingredients_per_trip,
             "warnings": warnings,
             "calorie_adjustments": dict(calorie_delta_per_profile),
+            # Lookup built for rounding, reused by create_shopping_tasks
+            "meals_by_id": meals_by_id,
         }
 
     def create_shopping_tasks(self, meal_plan: Dict[str, Any]) -> List[Task]:
@@ -889,15 +977,20 @@ class MealPlanner:
         # NEW: Round ingredients at meal plan level and get per-trip distributions
         rounding_result = self.round_and_distribute_ingredients(meal_plan)
 
-        # Build lookup by scheduled meal instance ID
-        meals_by_id = {meal["id"]: meal for meal in meal_plan["meals"]}
+        # Lookup by scheduled meal instance ID, already built for rounding
+        meals_by_id = rounding_result["meals_by_id"]
+
+        # Loop-invariant lookups
+        diet_profiles = self.config.diet_profiles
+        emoji = "🛒 " if self.config.use_emojis else ""
+        seasoning_note = self.loc.t("seasoning_note")
 
         for trip_index, trip in enumerate(meal_plan["shopping_trips"]):
             # Get pre-calculated rounded ingredients for this trip
             all_ingredients = rounding_result["ingredients_per_trip"][trip_index]
 
             # Collect meal info
-            meal_name_counts = {}  # meal_name -> {diet_profile: count}
+            meal_name_counts = defaultdict(Counter)  # meal_name -> {diet_profile: count}
             all_eating_dates = []  # Collect all eating dates for date range
             all_seasonings = set()  # Collect unique seasonings
 
@@ -906,25 +999,17 @@ class MealPlanner:
                     meal = meals_by_id[scheduled_meal_id]
                     meal_name = meal["name"]
 
-                    # Count portions by diet type
-                    if meal_name not in meal_name_counts:
-                        meal_name_counts[meal_name] = {}
-
+                    # Count portions by diet type (people sharing a diet profile add up)
+                    diet_counts = meal_name_counts[meal_name]
                     eating_dates_per_person = meal.get("eating_dates_per_person", {})
                     for person, eating_dates in eating_dates_per_person.items():
-                        # Map person to their diet profile
-                        diet_profile = self.config.diet_profiles.get(person, person)
-                        portions = len(eating_dates)
-                        meal_name_counts[meal_name][diet_profile] = (
-                            meal_name_counts[meal_name].get(diet_profile, 0) + portions
-                        )
+                        diet_counts[diet_profiles.get(person, person)] += len(eating_dates)
                         all_eating_dates.extend(eating_dates)
 
                     # Collect seasonings from this meal
                     if "suggested_seasonings" in meal and meal["suggested_seasonings"]:
                         # Parse comma-separated seasonings and clean whitespace
-                        seasonings = [s.strip() for s in meal["suggested_seasonings"].split(",")]
-                        all_seasonings.update(seasonings)
+                        all_seasonings.update(_SEASONING_SPLIT.split(meal["suggested_seasonings"].strip()))
 
             # Add seasonings as pseudo-ingredients to the shopping list
             for seasoning in sorted(all_seasonings):
@@ -933,7 +1018,7 @@ class MealPlanner:
                     "quantity": "",  # No quantity for seasonings
                     "unit": "",
                     "category": "spices",
-                    "notes": self.loc.t("seasoning_note"),
+                    "notes": seasoning_note,
                 }
                 all_ingredients.append(seasoning_item)
 
@@ -949,7 +1034,6 @@ class MealPlanner:
                     date_range_str = f" ({first_date} - {last_date})"
 
             # Create task title with localization
-            emoji = "🛒 " if self.config.use_emojis else ""
             # Build meals string for title
             meals_str = ", ".join(sorted(meal_name_counts.keys()))
             task_title = self.loc.t("shopping_task_title", emoji=emoji, meals=meals_str + date_range_str)
@@ -1098,21 +1182,20 @@ class MealPlanner:
         Scales quantities based on the person's total eating dates.
         """
         result = []
-        people_set = set(people_eating_today)
+        # Scale factor per person from their total eating dates (1 portion per eating date), computed once
+        scales = {}
+        for person in set(people_eating_today):
+            total_dates = len(eating_dates_per_person.get(person, []))
+            scales[person] = 1.0 / total_dates if total_dates > 0 else 1.0
 
         for ing in ingredients:
             ing_copy = ing.copy()
             if "per_person" in ing_copy:
                 # Filter AND scale
                 scaled_per_person = {}
-                for person in people_set:
+                for person, scale in scales.items():
                     if person in ing_copy["per_person"]:
                         data = ing_copy["per_person"][person]
-                        # Calculate scale factor using total eating dates
-                        total_dates = len(eating_dates_per_person.get(person, []))
-                        # Assuming 1 portion per eating date
-                        scale = 1.0 / total_dates if total_dates > 0 else 1.0
-
                         scaled_per_person[person] = {
                             "quantity": round(data["quantity"] * scale),
                             "unit": data["unit"],
@@ -1129,16 +1212,43 @@ class MealPlanner:
 
         return result
 
+    def _steps_and_seasonings_lines(self, meal: Dict[str, Any]) -> List[str]:
+        """Description lines for a meal's cooking steps and suggested seasonings, shared by its tasks."""
+        lines = []
+        # Add cooking steps if available
+        if meal.get("steps"):
+            lines.append("\n" + self.loc.t("cooking_steps_header"))
+            for i, step in enumerate(meal["steps"], 1):
+                lines.append(f"{i}. {step}")
+
+        # Add suggested seasonings if available
+        if meal.get("suggested_seasonings"):
+            lines.append(f"\n{self.loc.t('suggested_seasonings_label')}: {meal['suggested_seasonings']}")
+        return lines
+
     def create_cooking_tasks(self, meal_plan: Dict[str, Any]) -> List[Task]:
         """Generate cooking tasks from meal plan."""
         tasks = []
 
+        # Loop-invariant lookups
+        emoji = "👨‍🍳 " if self.config.use_emojis else ""
+        portion_singular = self.loc.t("portion_singular")
+        portion_plural = self.loc.t("portion_plural")
+        meal_prep_note = self.loc.t("cooking_task_meal_prep_note")
+        diet_profiles = self.config.diet_profiles
+
         for meal in meal_plan["meals"]:
             # Get and sort cooking dates
             cooking_dates = sorted(meal.get("cooking_dates", []))
             num_cooking_sessions = len(cooking_dates)
             is_meal_prep = num_cooking_sessions == 1
 
+            # Per-profile calories don't depend on the cooking date
+            meal_calories = self.calculate_meal_calories(meal)
+
+            # Category order is the same for every cooking date; filtering per date keeps it
+            ordered_ingredients = self.sort_ingredients_by_category(meal["ingredients"])
+
             # Extract portions info from ingredients (once, outside loop)
             portions_by_person = {}
             for ing in meal["ingredients"]:
@@ -1147,22 +1257,28 @@ class MealPlanner:
                         if "portions" in data:
                             if person not in portions_by_person:
                                 portions_by_person[person] = data["portions"]
+            portions_persons = sorted(portions_by_person)
+
+            meal_type_translated = self.loc.get_meal_type_translation(meal["meal_type"])
+            eating_dates_per_person = meal.get("eating_dates_per_person", {})
+            eating_persons = sorted(eating_dates_per_person)
+            eating_counts = {person: len(dates) for person, dates in eating_dates_per_person.items()}
+
+            # Date-independent text, localized once per meal
+            base_title = self.loc.t("cooking_task_title", emoji=emoji, meal=meal["name"])
+            footer_lines = [f"\n{meal['notes']}"] if meal.get("notes") else []
+            footer_lines.extend(self._steps_and_seasonings_lines(meal))
 
             # Create a cooking task for each date
             for idx, cooking_date in enumerate(cooking_dates):
-                emoji = "👨‍🍳 " if self.config.use_emojis else ""
-                task_title = self.loc.t("cooking_task_title", emoji=emoji, meal=meal["name"])
+                task_title = base_title
                 if not is_meal_prep:
                     task_title += f" ({cooking_date})"
 
-                # Build description
-                meal_type_translated = self.loc.get_meal_type_translation(meal["meal_type"])
-                # Check if anyone eats on this cooking date (move this up before descriptions)
-                eating_dates_per_person = meal.get("eating_dates_per_person", {})
-                people_eating_today = []
-                for person, dates in eating_dates_per_person.items():
-                    if cooking_date in dates:
-                        people_eating_today.append(person)
+                # Check if anyone eats on this cooking date (sorted once, reused by every section below)
+                people_eating_today = [
+                    person for person in eating_persons if cooking_date in eating_dates_per_person[person]
+                ]
 
                 description_lines = [
                     self.loc.t(
@@ -1177,11 +1293,9 @@ class MealPlanner:
                     # For meal prep, show all portions
                     if portions_by_person:
                         portions_info = []
-                        for person in sorted(portions_by_person.keys()):
+                        for person in portions_persons:
                             total_portions = portions_by_person[person]
-                            portion_word = (
-                                self.loc.t("portion_singular") if total_portions == 1 else self.loc.t("portion_plural")
-                            )
+                            portion_word = portion_singular if total_portions == 1 else portion_plural
                             portions_info.append(f"{person}: {total_portions} {portion_word}")
                         description_lines.append(
                             self.loc.t("cooking_task_description_portions", portions=", ".join(portions_info))
@@ -1190,25 +1304,22 @@ class MealPlanner:
                     # For multiple cooking dates, show only people eating today
                     if people_eating_today:
                         portions_info = []
-                        for person in sorted(people_eating_today):
+                        for person in people_eating_today:
                             # Each person gets 1 portion on their eating date
-                            portion_word = self.loc.t("portion_singular")
-                            portions_info.append(f"{person}: 1 {portion_word}")
+                            portions_info.append(f"{person}: 1 {portion_singular}")
                         description_lines.append(
                             self.loc.t("cooking_task_description_portions", portions=", ".join(portions_info))
                         )
 
-                # Calculate and add per-portion calorie info
-                meal_calories = self.calculate_meal_calories(meal)
-
+                # Add per-portion calorie info
                 # Show calories only for people eating today (or all for meal prep)
-                people_for_calories = sorted(portions_by_person.keys()) if is_meal_prep else sorted(people_eating_today)
+                people_for_calories = portions_persons if is_meal_prep else people_eating_today
 
                 if meal_calories and people_for_calories:
                     calories_info = []
                     for person in people_for_calories:
                         # Map person to their diet profile
-                        diet_profile = self.config.diet_profiles.get(person, person)
+                        diet_profile = diet_profiles.get(person, person)
 
                         if diet_profile in meal_calories:
                             total_calories = meal_calories[diet_profile]
@@ -1223,8 +1334,7 @@ class MealPlanner:
                             else:
                                 # For multiple sessions: show calories for 1 portion (their eating on this date)
                                 # Total calories represent all portions, need to divide by person's total eating dates
-                                person_eating_dates = eating_dates_per_person.get(person, [])
-                                num_person_portions = len(person_eating_dates)
+                                num_person_portions = eating_counts.get(person, 0)
                                 calories_per_portion = (
                                     total_calories // num_person_portions if num_person_portions > 0 else total_calories
                                 )
@@ -1250,38 +1360,26 @@ class MealPlanner:
 
                 # Add eating info (already calculated people_eating_today at top)
                 if people_eating_today:
-                    people_str = ", ".join(sorted(people_eating_today))
+                    people_str = ", ".join(people_eating_today)
                     description_lines.append(self.loc.t("cooking_task_eating_today", people=people_str))
                 else:
                     # Nobody eats on cooking day - note for meal prep
-                    description_lines.append(self.loc.t("cooking_task_meal_prep_note"))
+                    description_lines.append(meal_prep_note)
 
-                if meal.get("notes"):
-                    description_lines.append(f"\n{meal['notes']}")
-
-                # Add cooking steps if available
-                if meal.get("steps"):
-                    description_lines.append("\n" + self.loc.t("cooking_steps_header"))
-                    for i, step in enumerate(meal["steps"], 1):
-                        description_lines.append(f"{i}. {step}")
-
-                # Add suggested seasonings if available
-                if meal.get("suggested_seasonings"):
-                    description_lines.append(
-                        f"\n{self.loc.t('suggested_seasonings_label')}: {meal['suggested_seasonings']}"
-                    )
+                # Notes, steps and seasonings are the same for every cooking date
+                description_lines.extend(footer_lines)
 
                 description = "\n".join(description_lines)
 
                 # Create per-person portion subtasks with adjusted quantities
                 if is_meal_prep:
-                    subtasks = self.create_person_portion_subtasks(meal["ingredients"])
+                    subtasks = self.create_person_portion_subtasks(ordered_ingredients, presorted=True)
                 else:
                     # Filter and scale ingredients for this specific cooking date
                     daily_ingredients = self.calculate_daily_ingredients(
-                        meal["ingredients"], people_eating_today, eating_dates_per_person
+                        ordered_ingredients, people_eating_today, eating_dates_per_person
                     )
-                    subtasks = self.create_person_portion_subtasks(daily_ingredients)
+                    subtasks = self.create_person_portion_subtasks(daily_ingredients, presorted=True)
 
                 task = Task(
                     title=task_title,
@@ -1299,18 +1397,24 @@ class MealPlanner:
 
     def create_serving_tasks(self, meal_plan: Dict[str, Any]) -> List[Task]:
         """Generate serving tasks ONLY for dates where no cooking happens."""
-        from collections import defaultdict
-
         tasks = []
+        emoji = "🍽️ " if self.config.use_emojis else ""
+        ingredients_header = "\n" + self.loc.t("ingredients_header")
 
         for meal in meal_plan["meals"]:
             meal_name = meal["name"]
             cooking_dates_set = set(meal.get("cooking_dates", []))
             eating_dates_per_person = meal.get("eating_dates_per_person", {})
+            eating_counts = {person: len(dates) for person, dates in eating_dates_per_person.items()}
             meal_calories = self.calculate_meal_calories(meal)
             assigned_cook = meal.get("assigned_cook", "")
 
-            # Group eating dates by date (track who eats when)
+            # Date-independent text, localized once per meal
+            task_title = self.loc.t("serving_task_title", emoji=emoji, meal=meal_name)
+            footer_lines = self._steps_and_seasonings_lines(meal)
+
+            # Group eating dates by date (track who eats when). A plain defaultdict loop beats
+            # building (date, person) pairs and sort+groupby, and keeps first-seen date order.
             dates_to_people = defaultdict(list)
             for person, dates in eating_dates_per_person.items():
                 for date in dates:
@@ -1320,9 +1424,6 @@ class MealPlanner:
 
             # Create task for each non-cooking eating date
             for date, people in dates_to_people.items():
-                emoji = "🍽️ " if self.config.use_emojis else ""
-                task_title = self.loc.t("serving_task_title", emoji=emoji, meal=meal_name)
-
                 # Build description with multiple parts
                 description_lines = []
 
@@ -1336,9 +1437,7 @@ class MealPlanner:
                     for person in people:
                         # meal_calories has person names as keys (from per_person data)
                         if person in meal_calories:
-                            total_cals = meal_calories[person]
-                            num_eating_dates = len(eating_dates_per_person[person])
-                            calories_per_portion[person] = total_cals // num_eating_dates
+                            calories_per_portion[person] = meal_calories[person] // eating_counts[person]
 
                     if calories_per_portion:
                         cal_info = ", ".join(f"{p}: ~{c} kcal" for p, c in calories_per_portion.items())
@@ -1349,38 +1448,22 @@ class MealPlanner:
                     meal["ingredients"], people, eating_dates_per_person
                 )
                 if daily_ingredients:
-                    description_lines.append("\n" + self.loc.t("ingredients_header"))
-                    # Group by category and format
-                    by_category = self.group_ingredients_by_category(daily_ingredients)
-                    for category in self.config.shopping_categories:
-                        if category not in by_category:
-                            continue
-                        sorted_ingredients = sorted(by_category[category], key=lambda x: x["name"])
-                        for ing in sorted_ingredients:
-                            # Show per-person breakdown
-                            if "per_person" in ing:
-                                for person in sorted(ing["per_person"].keys()):
-                                    person_data = ing["per_person"][person]
-                                    display_qty, display_unit = self.convert_ingredient_for_display(
-                                        ing["name"], person_data["quantity"], person_data["unit"]
-                                    )
-                                    description_lines.append(f"  • {person}: {display_qty}{display_unit} {ing['name']}")
-
-                # Add cooking steps if available
-                if meal.get("steps"):
-                    description_lines.append("\n" + self.loc.t("cooking_steps_header"))
-                    for i, step in enumerate(meal["steps"], 1):
-                        description_lines.append(f"{i}. {step}")
-
-                # Add suggested seasonings if available
-                if meal.get("suggested_seasonings"):
-                    description_lines.append(
-                        f"\n{self.loc.t('suggested_seasonings_label')}: {meal['suggested_seasonings']}"
-                    )
+                    description_lines.append(ingredients_header)
+                    # Order by category and format
+                    for ing in self.sort_ingredients_by_category(daily_ingredients):
+                        # Show per-person breakdown
+                        if "per_person" in ing:
+                            for person in sorted(ing["per_person"].keys()):
+                                person_data = ing["per_person"][person]
+                                display_qty, display_unit = self.convert_ingredient_for_display(
+                                    ing["name"], person_data["quantity"], person_data["unit"]
+                                )
+                                description_lines.append(f"  • {person}: {display_qty}{display_unit} {ing['name']}")
 
-                description = "\n".join(description_lines)
+                # Steps and seasonings are the same for every serving date
+                description_lines.extend(footer_lines)
 
-                subtasks = []
+                description = "\n".join(description_lines)
 
                 task = Task(
                     title=task_title,
@@ -1390,7 +1473,6 @@ class MealPlanner:
                     assigned_to=assigned_cook,
                     meal_id=meal["meal_id"],
                     task_type="serving",
-                    subtasks=subtasks,
                 )
                 tasks.append(task)
 
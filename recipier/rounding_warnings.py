@@ -6,11 +6,84 @@ will be significantly rounded due to package size constraints and
 generating helpful warnings with suggestions for reducing the impact.
 """
 
-from typing import Any, Dict, Optional
+import math
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Rounding that changes an ingredient's total by more than this fraction gets a warning
+WARNING_CHANGE_RATIO = 0.5
+
+
+def needs_rounding_warning(original_total: float, rounded_total: float) -> bool:
+    """Cheap pre-check: whether generate_rounding_warning() would return a warning for these totals."""
+    return original_total != 0 and abs(rounded_total - original_total) / original_total > WARNING_CHANGE_RATIO
+
+
+def _meal_additional_portions(current_portions: int, qty_per_portion: float, unit_size: float) -> int:
+    """
+    Smallest number of extra portions (1-9) that brings one meal's quantity within 30% of
+    a whole number of units, or 0 if none does.
+    """
+    # A total below unit_size / 1.3 is more than 30% away from any multiple of unit_size (it rounds to
+    # 0 or falls short of 1 unit by too much), so start at the first count that can reach it.
+    # The bound is conservative by one portion, leaving exact boundary cases to the check below.
+    first = 1
+    if qty_per_portion > 0:
+        first = max(1, math.floor(unit_size / 1.3 / qty_per_portion) - current_portions)
+
+    for add_portions in range(first, 10):
+        test_total = (current_portions + add_portions) * qty_per_portion
+        test_rounded = round(test_total / unit_size) * unit_size
+        if abs(test_rounded - test_total) / test_total <= 0.3:  # Less strict for individual meals
+            return add_portions
+    return 0
+
+
+def _combined_increase(meal_quantities: List[Dict[str, Any]], unit_size: float) -> int:
+    """
+    Smallest number of extra portions (1-5) that, added to every meal, brings the combined
+    quantity within 50% of a whole number of units, or 0 if none does.
+    """
+    # Adding the same portions to every meal grows the total linearly, so sum once instead of per candidate
+    base_total = sum(mq["current_portions"] * mq["qty_per_portion"] for mq in meal_quantities)
+    total_per_added_portion = sum(mq["qty_per_portion"] for mq in meal_quantities)
+
+    # A total below 2/3 of unit_size is more than 50% away from any multiple of unit_size, and every
+    # total from there up passes, so this is usually the answer. Conservative by one portion, as above.
+    first = 1
+    if total_per_added_portion > 0:
+        first = max(1, math.floor((unit_size * 2 / 3 - base_total) / total_per_added_portion))
+
+    for add_portions in range(first, 6):  # Max 5 additional portions
+        new_total = base_total + add_portions * total_per_added_portion
+        new_rounded = round(new_total / unit_size) * unit_size
+        if abs(new_rounded - new_total) / new_total <= 0.5:
+            return add_portions
+    return 0
+
+
+def meal_portions(meal: Dict[str, Any]) -> int:
+    """Total portions of a meal (sum of eating dates across all people)."""
+    return sum(len(dates) for dates in meal.get("eating_dates_per_person", {}).values())
+
+
+def _meals_using(
+    ingredient_name: str, meal_plan: Dict[str, Any]
+) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any], int]]:
+    """Yield (meal, ingredient, portions) for each meal in the plan that uses the ingredient, in plan order."""
+    for meal in meal_plan["meals"]:
+        for ing in meal["ingredients"]:
+            if ing["name"] == ingredient_name:
+                yield meal, ing, meal_portions(meal)
+                break
 
 
 def generate_rounding_warning(
-    ingredient_name: str, original_total: float, rounded_total: float, unit_size: float, meal_plan: Dict[str, Any]
+    ingredient_name: str,
+    original_total: float,
+    rounded_total: float,
+    unit_size: float,
+    meal_plan: Dict[str, Any],
+    ingredient_index: Optional[Dict[str, Sequence[Tuple[Dict[str, Any], Dict[str, Any], int]]]] = None,
 ) -> Optional[Dict[str, Any]]:
     """
     Generate warning if ingredient change exceeds 50% at meal plan level.
@@ -21,6 +94,8 @@ def generate_rounding_warning(
         rounded_total: Rounded quantity (multiple of unit_size)
         unit_size: Package/unit size in grams/ml
         meal_plan: Expanded meal plan with meals and per_person data
+        ingredient_index: Optional {ingredient_name: [(meal, ingredient, portions), ...]} index of
+            meal_plan (in plan order), used instead of scanning every meal's ingredient list
 
     Returns:
         Warning dict with ingredient_name, original_quantity, rounded_quantity,
@@ -35,88 +110,67 @@ def generate_rounding_warning(
         - Current portion count
         - Suggested additional portions for that specific meal
     """
-    if original_total == 0:
+    if not needs_rounding_warning(original_total, rounded_total):
         return None
 
     change_ratio = abs(rounded_total - original_total) / original_total
 
-    if change_ratio > 0.5:
-        # Find which meals use this ingredient
-        meal_info = []
-        meal_quantities = []  # Store (meal_name, current_portions, qty_per_portion) for later calculations
-
-        for meal in meal_plan["meals"]:
-            # Check if this meal contains the ingredient
-            has_ingredient = any(ing["name"] == ingredient_name for ing in meal["ingredients"])
-            if has_ingredient:
-                # Calculate current portions (sum of eating dates across all people)
-                eating_dates_per_person = meal.get("eating_dates_per_person", {})
-                current_portions = sum(len(dates) for dates in eating_dates_per_person.values())
-
-                # Get ingredient quantity for this meal
-                meal_ingredient = next((ing for ing in meal["ingredients"] if ing["name"] == ingredient_name), None)
-                if meal_ingredient:
-                    meal_qty = meal_ingredient["quantity"]
-                    qty_per_portion = meal_qty / current_portions if current_portions > 0 else meal_qty
-
-                    meal_quantities.append(
-                        {
-                            "meal_name": meal["name"],
-                            "current_portions": current_portions,
-                            "qty_per_portion": qty_per_portion,
-                            "total_qty": meal_qty,
-                        }
-                    )
-
-                    # Calculate suggested additional portions for this specific meal alone
-                    suggested_additional = 0
-                    for add_portions in range(1, 10):
-                        test_total = (current_portions + add_portions) * qty_per_portion
-                        test_rounded = round(test_total / unit_size) * unit_size
-                        if abs(test_rounded - test_total) / test_total <= 0.3:  # Less strict for individual meals
-                            suggested_additional = add_portions
-                            break
-
-                    meal_info.append(
-                        {
-                            "meal_name": meal["name"],
-                            "current_portions": current_portions,
-                            "suggested_additional_portions": suggested_additional,
-                        }
-                    )
-
-        # Calculate combined increase option (increase all meals by same amount)
-        # Only suggest up to 5 additional portions per meal as practical limit
-        combined_increase = 0
-        if len(meal_quantities) > 1:
-            # Find the minimum increase needed when all meals increase together
-            for add_portions in range(1, 6):  # Max 5 additional portions
-                # Calculate new total if we add portions to all meals
-                new_total = sum(
-                    (mq["current_portions"] + add_portions) * mq["qty_per_portion"] for mq in meal_quantities
-                )
-                new_rounded = round(new_total / unit_size) * unit_size
-                if abs(new_rounded - new_total) / new_total <= 0.5:
-                    combined_increase = add_portions
-                    break
-
-        # Filter meal_info to only show practical suggestions (≤5 portions)
-        practical_meal_info = []
-        for meal in meal_info:
-            if meal["suggested_additional_portions"] > 0 and meal["suggested_additional_portions"] <= 5:
-                practical_meal_info.append(meal)
-            elif meal["suggested_additional_portions"] == 0:
-                # Include meals with no practical solution
-                practical_meal_info.append(meal)
-
-        return {
-            "ingredient_name": ingredient_name,
-            "original_quantity": original_total,
-            "rounded_quantity": rounded_total,
-            "percent_change": change_ratio,
-            "meals": practical_meal_info,
-            "combined_increase": combined_increase,
-            "unit_size": unit_size,
-        }
-
-    return None
+    # Find which meals use this ingredient
+    meal_info = []
+    meal_quantities = []  # Store (meal_name, current_portions, qty_per_portion) for later calculations
+
+    if ingredient_index is not None:
+        meals_using = ingredient_index.get(ingredient_name, ())
+    else:
+        meals_using = _meals_using(ingredient_name, meal_plan)
+
+    for meal, meal_ingredient, current_portions in meals_using:
+        # Get ingredient quantity for this meal
+        meal_qty = meal_ingredient["quantity"]
+        qty_per_portion = meal_qty / current_portions if current_portions > 0 else meal_qty
+
+        meal_quantities.append(
+            {
+                "meal_name": meal["name"],
+                "current_portions": current_portions,
+                "qty_per_portion": qty_per_portion,
+                "total_qty": meal_qty,
+            }
+        )
+
+        # Calculate suggested additional portions for this specific meal alone
+        suggested_additional = _meal_additional_portions(current_portions, qty_per_portion, unit_size)
+
+        meal_info.append(
+            {
+                "meal_name": meal["name"],
+                "current_portions": current_portions,
+                "suggested_additional_portions": suggested_additional,
+            }
+        )
+
+    # Calculate combined increase option (increase all meals by same amount)
+    # Only suggest up to 5 additional portions per meal as practical limit
+    combined_increase = 0
+    if len(meal_quantities) > 1:
+        # Find the minimum increase needed when all meals increase together
+        combined_increase = _combined_increase(meal_quantities, unit_size)
+
+    # Filter meal_info to only show practical suggestions (≤5 portions)
+    practical_meal_info = []
+    for meal in meal_info:
+        if meal["suggested_additional_portions"] > 0 and meal["suggested_additional_portions"] <= 5:
+            practical_meal_info.append(meal)
+        elif meal["suggested_additional_portions"] == 0:
+            # Include meals with no practical solution
+            practical_meal_info.append(meal)
+
+    return {
+        "ingredient_name": ingredient_name,
+        "original_quantity": original_total,
+        "rounded_quantity": rounded_total,
+        "percent_change": change_ratio,
+        "meals": practical_meal_info,
+        "combined_increase": combined_increase,
+        "unit_size": unit_size,
+    }
@@ -5,40 +5,54 @@ Backend server entry point for Recipier.
 This module provides a CLI command to start the FastAPI backend server.
 
 Usage:
-    recipier-backend [--port PORT] [--host HOST] [--reload]
+    recipier-backend [--port PORT] [--host HOST] [--reload | --no-reload]
+
+Auto-reload defaults to on only when run from an interactive terminal.
 """
 
 import argparse
 import os
 import sys
+from pathlib import Path
+
+# Project root (parent of the recipier package) and the backend package inside it
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+BACKEND_DIR = PROJECT_ROOT / "backend"
 
 
 def main():
     parser = argparse.ArgumentParser(description="Start the Recipier backend API server")
     parser.add_argument("--port", type=int, default=8000, help="Port to run the server on (default: 8000)")
     parser.add_argument("--host", default="127.0.0.1", help="Host to bind to (default: 127.0.0.1)")
-    parser.add_argument(
+    reload_group = parser.add_mutually_exclusive_group()
+    reload_group.add_argument(
         "--reload",
         action="store_true",
-        help="Enable auto-reload on code changes (development mode)",
+        help="Enable auto-reload on code changes (default when run from a terminal)",
+    )
+    reload_group.add_argument(
+        "--no-reload",
+        action="store_true",
+        help="Disable auto-reload (default when not run from a terminal, e.g. CI or containers)",
     )
-    parser.add_argument("--no-reload", action="store_true", help="Disable auto-reload (production mode)")
 
     args = parser.parse_args()
 
-    # Determine reload setting (default to True for development)
-    reload = args.reload or not args.no_reload
-
-    # Find project root (parent of recipier package)
-    project_root = os.path.dirname(os.path.dirname(__file__))
-    backend_dir = os.path.join(project_root, "backend")
+    # Determine reload setting. Reloading runs a file watcher, so only default to it for interactive
+    # development; non-interactive runs (CI, containers, services) get a plain server.
+    if args.reload:
+        reload = True
+    elif args.no_reload:
+        reload = False
+    else:
+        reload = sys.stdout.isatty()
 
-    if not os.path.exists(backend_dir):
-        print(f"✗ Error: Backend directory not found at {backend_dir}")
+    if not BACKEND_DIR.is_dir():
+        print(f"✗ Error: Backend directory not found at {BACKEND_DIR}")
         sys.exit(1)
 
     # Change to project root so imports work correctly
-    os.chdir(project_root)
+    os.chdir(PROJECT_ROOT)
 
     print("🚀 Starting Recipier Backend")
     print("=" * 50)
@@ -9,9 +9,14 @@ Usage:
 """
 
 import argparse
-import os
+import shutil
 import subprocess
 import sys
+from pathlib import Path
+
+# Frontend sources live next to the recipier package
+FRONTEND_DIR = Path(__file__).resolve().parent.parent / "frontend"
+NODE_MODULES_DIR = FRONTEND_DIR / "node_modules"
 
 
 def main():
@@ -27,24 +32,20 @@ def main():
     args = parser.parse_args()
 
     # Find frontend directory
-    frontend_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "frontend")
-    if not os.path.exists(frontend_dir):
-        print(f"✗ Error: Frontend directory not found at {frontend_dir}")
+    if not FRONTEND_DIR.is_dir():
+        print(f"✗ Error: Frontend directory not found at {FRONTEND_DIR}")
         sys.exit(1)
 
-    # Check if npm is available
-    try:
-        subprocess.run(["npm", "--version"], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    # Check if npm is available (a PATH lookup - no need to spawn npm just to ask for its version)
+    if shutil.which("npm") is None:
         print("✗ Error: npm is not installed or not in PATH")
         print("   Please install Node.js and npm: https://nodejs.org/")
         sys.exit(1)
 
     # Check if node_modules exists
-    node_modules = os.path.join(frontend_dir, "node_modules")
-    if not os.path.exists(node_modules):
+    if not NODE_MODULES_DIR.is_dir():
         print("📦 Installing frontend dependencies...")
-        result = subprocess.run(["npm", "install"], cwd=frontend_dir)
+        result = subprocess.run(["npm", "install"], cwd=FRONTEND_DIR)
         if result.returncode != 0:
             print("✗ Error: Failed to install dependencies")
             sys.exit(1)
@@ -52,13 +53,13 @@ def main():
     print("🎨 Starting Recipier Frontend")
     print("=" * 50)
     print(f"   Command: npm run {args.command}")
-    print(f"   Directory: {frontend_dir}")
+    print(f"   Directory: {FRONTEND_DIR}")
     if args.command == "dev":
         print(f"   URL: http://localhost:5173 (default Vite port)")
     print("=" * 50)
 
     # Run the npm command
-    result = subprocess.run(["npm", "run", args.command], cwd=frontend_dir)
+    result = subprocess.run(["npm", "run", args.command], cwd=FRONTEND_DIR)
     sys.exit(result.returncode)
 
 
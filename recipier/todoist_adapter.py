@@ -3,7 +3,10 @@ Todoist adapter for meal planning tasks.
 This adapter takes Task objects and creates them in Todoist.
 """
 
-from typing import List, Optional
+import logging
+import sys
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
+from typing import Any, Iterable, Iterator, List, Optional
 
 from todoist_api_python.api import TodoistAPI
 
@@ -11,6 +14,44 @@ from recipier.config import TaskConfig
 from recipier.localization import Localizer
 from recipier.meal_planner import MealPlanner, Task
 
+logger = logging.getLogger(__name__)
+
+# Concurrent Todoist requests while creating subtasks - each add_task is a network round trip
+TODOIST_MAX_WORKERS = 4
+
+
+def _iter_results(results: Iterable[Any]) -> Iterator[Any]:
+    """
+    Yield items from a ResultsPaginator (an iterable of pages) or a flat list.
+    Pages are fetched lazily, so stopping early skips the remaining requests.
+    """
+    for page in results:
+        if isinstance(page, list):
+            yield from page
+        else:
+            yield page
+
+
+class _CliFormatter(logging.Formatter):
+    """Bare messages, with warnings prefixed the way the CLIs used to print them."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        return f"Warning: {message}" if record.levelno >= logging.WARNING else message
+
+
+def configure_cli_logging() -> None:
+    """
+    Print recipier's progress messages and warnings to stdout, alongside the calling CLI's own output.
+    Only the recipier loggers are turned up to INFO, so HTTP client chatter stays hidden.
+    """
+    recipier_logger = logging.getLogger("recipier")
+    if not any(isinstance(handler.formatter, _CliFormatter) for handler in recipier_logger.handlers):
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(_CliFormatter())
+        recipier_logger.addHandler(handler)
+    recipier_logger.setLevel(logging.INFO)
+
 
 class TodoistAdapter:
     """Adapter for creating tasks in Todoist."""
@@ -28,72 +69,71 @@ class TodoistAdapter:
         self.localizer = Localizer(language=self.config.language)
         self.project_id: Optional[str] = None
         self.sections: dict[str, str] = {}  # task_type -> section_id
+        # task_type -> labels added to every parent task of that type
+        todoist_config = self.config.todoist
+        self.labels_by_type: dict[str, List[str]] = {
+            "shopping": todoist_config.shopping_labels,
+            "prep": todoist_config.prep_labels,
+            "cooking": todoist_config.cooking_labels,
+            "serving": todoist_config.serving_labels,
+        }
+        # task_type -> localized section name
+        self.section_names: dict[str, str] = {
+            "shopping": self.localizer.get_section_name("shopping"),
+            "prep": self.localizer.get_section_name("prep"),
+            "cooking": self.localizer.get_section_name("cooking"),
+            "serving": self.localizer.get_section_name("eating"),
+        }
 
     def get_or_create_project(self) -> str:
         """Get existing project ID or create a new project."""
         try:
-            # get_projects() returns a ResultsPaginator
-            projects_paginator = self.api.get_projects()
-
-            # Convert to list to iterate
-            projects = list(projects_paginator)
-
-            # Flatten if nested (ResultsPaginator returns list of lists)
-            if projects and isinstance(projects[0], list):
-                projects = [p for sublist in projects for p in sublist]
-
-            for project in projects:
+            # get_projects() returns a ResultsPaginator; stop fetching pages once the project is found
+            for project in _iter_results(self.api.get_projects()):
                 if project.name == self.config.todoist.project_name:
                     self.project_id = project.id
-                    print(f"✓ Using existing project: {self.config.todoist.project_name}")
+                    logger.info("✓ Using existing project: %s", self.config.todoist.project_name)
                     return project.id
         except Exception as e:
-            print(f"Warning: Error fetching projects: {e}")
+            logger.warning("Error fetching projects: %s", e)
 
         # Create new project if not found
-        print(f"Creating new project: {self.config.todoist.project_name}")
+        logger.info("Creating new project: %s", self.config.todoist.project_name)
         project = self.api.add_project(name=self.config.todoist.project_name)
         self.project_id = project.id
-        print(f"✓ Created new project: {self.config.todoist.project_name}")
+        logger.info("✓ Created new project: %s", self.config.todoist.project_name)
         return project.id
 
     def get_user_ids(self) -> None:
+        """Map configured people to the ids of the project's collaborators with matching names."""
         self.user_ids = {}
         try:
-            collaborators = list(self.api.get_collaborators(project_id="6fgJjvvgQX92XJcf"))[0]
-            for user in collaborators:
+            # get_collaborators() returns a ResultsPaginator; read every page, not just the first
+            for user in _iter_results(self.api.get_collaborators(project_id=self.project_id)):
                 for key, name in self.config.todoist.user_mapping.items():
                     if user.name == name:
                         self.user_ids[key] = user.id
         except Exception as e:
-            print(f"Warning: Could not fetch user ids: {e}")
+            logger.warning("Could not fetch user ids: %s", e)
 
     def get_or_create_sections(self) -> None:
         """Get or create sections for organizing tasks."""
         if not self.config.todoist.use_sections:
             return
 
-        # Get existing sections (returns ResultsPaginator)
-        try:
-            sections_paginator = self.api.get_sections(project_id=self.project_id)
-            sections = list(sections_paginator)
-
-            # Flatten if needed (same as projects)
-            if sections and isinstance(sections[0], list):
-                sections = [s for sublist in sections for s in sublist]
+        section_names = self.section_names
 
-            section_map = {s.name: s.id for s in sections}
+        # Get existing sections (returns ResultsPaginator); stop fetching pages once all are found
+        section_map = {}
+        try:
+            wanted = set(section_names.values())
+            for section in _iter_results(self.api.get_sections(project_id=self.project_id)):
+                if section.name in wanted and section.name not in section_map:
+                    section_map[section.name] = section.id
+                    if len(section_map) == len(wanted):
+                        break
         except Exception as e:
-            print(f"Warning: Could not fetch sections: {e}")
-            section_map = {}
-
-        # Map task types to localized section names
-        section_names = {
-            "shopping": self.localizer.get_section_name("shopping"),
-            "prep": self.localizer.get_section_name("prep"),
-            "cooking": self.localizer.get_section_name("cooking"),
-            "serving": self.localizer.get_section_name("eating"),
-        }
+            logger.warning("Could not fetch sections: %s", e)
 
         # Create or get section IDs
         for task_type, section_name in section_names.items():
@@ -129,26 +169,18 @@ class TodoistAdapter:
         if task.due_date:
             task_params["due_string"] = task.due_date
 
-        # Add parent if this is a subtask
-        if parent_id:
-            task_params["parent_id"] = parent_id
-        # Otherwise add section if configured and not a subtask
-        elif self.config.todoist.use_sections and task.task_type in self.sections:
-            task_params["section_id"] = self.sections[task.task_type]
-
         # Add labels if present (task-specific labels + task type labels from config)
         labels = list(task.labels) if task.labels else []
 
-        # Add task type labels from config if not a subtask
-        if not parent_id and task.task_type:
-            if task.task_type == "shopping" and self.config.todoist.shopping_labels:
-                labels.extend(self.config.todoist.shopping_labels)
-            elif task.task_type == "prep" and self.config.todoist.prep_labels:
-                labels.extend(self.config.todoist.prep_labels)
-            elif task.task_type == "cooking" and self.config.todoist.cooking_labels:
-                labels.extend(self.config.todoist.cooking_labels)
-            elif task.task_type == "serving" and self.config.todoist.serving_labels:
-                labels.extend(self.config.todoist.serving_labels)
+        # Add parent if this is a subtask
+        if parent_id:
+            task_params["parent_id"] = parent_id
+        else:
+            # Otherwise add section (only filled in when sections are enabled) and task type labels
+            section_id = self.sections.get(task.task_type)
+            if section_id:
+                task_params["section_id"] = section_id
+            labels.extend(self.labels_by_type.get(task.task_type, ()))
 
         if labels:
             task_params["labels"] = labels
@@ -177,13 +209,42 @@ class TodoistAdapter:
         # Create sections if enabled
         self.get_or_create_sections()
 
-        for task in tasks:
-            # Create parent task
-            parent_id = self.create_task_in_todoist(task)
-
-            # Create subtasks
-            for subtask in task.subtasks:
-                self.create_task_in_todoist(subtask, parent_id=parent_id)
+        # Parents are created in order so they keep their order in Todoist. Each parent's subtasks are
+        # then created in order on a worker thread, overlapping with the remaining parents and the
+        # other subtask lists instead of waiting for every round trip one after another.
+        with ThreadPoolExecutor(max_workers=TODOIST_MAX_WORKERS) as executor:
+            subtask_batches: List[Future] = []
+            try:
+                for task in tasks:
+                    # Stop creating parents as soon as any subtask list has failed
+                    self._raise_first_failure(subtask_batches)
+
+                    # Create parent task
+                    parent_id = self.create_task_in_todoist(task)
+
+                    # Create subtasks
+                    if task.subtasks:
+                        subtask_batches.append(executor.submit(self._create_subtasks, task.subtasks, parent_id))
+
+                wait(subtask_batches, return_when=FIRST_EXCEPTION)
+                self._raise_first_failure(subtask_batches)
+            except BaseException:
+                # Drop subtask lists that have not started yet; ones already running finish their current list
+                for batch in subtask_batches:
+                    batch.cancel()
+                raise
+
+    @staticmethod
+    def _raise_first_failure(subtask_batches: List[Future]) -> None:
+        """Re-raise the error of the first finished subtask list that failed, if any."""
+        for batch in subtask_batches:
+            if batch.done() and not batch.cancelled() and batch.exception() is not None:
+                raise batch.exception()
+
+    def _create_subtasks(self, subtasks: List[Task], parent_id: str) -> None:
+        """Create subtasks under a parent, one after another so Todoist keeps their order."""
+        for subtask in subtasks:
+            self.create_task_in_todoist(subtask, parent_id=parent_id)
 
     def create_from_meal_plan(self, meal_plan_data: dict, meals_db: dict) -> None:
         """
@@ -9,38 +9,23 @@ import pytest
 class TestMealPlansAPI:
     """Tests for /api/meal-plan endpoints."""
 
-    def test_validate_meal_plan_with_no_eating_dates(self, api_client):
-        """Test validation error when no eating dates provided."""
+    @pytest.mark.parametrize(
+        "eating_dates_per_person",
+        [
+            {},  # Empty - no one eating
+            {"John": []},  # Person with an empty list
+        ],
+        ids=["no-eating-dates", "empty-person-dates"],
+    )
+    def test_validate_meal_plan_without_eating_dates(self, api_client, eating_dates_per_person):
+        """Test validation error when nobody, or a listed person, has no eating dates."""
         invalid_plan = {
             "scheduled_meals": [
                 {
                     "id": "sm_1",
                     "meal_id": "test_spaghetti",
                     "cooking_dates": ["2026-01-10"],
-                    "eating_dates_per_person": {},  # Empty - no one eating
-                    "meal_type": "dinner",
-                    "assigned_cook": "John",
-                }
-            ],
-            "shopping_trips": [],
-        }
-
-        response = api_client.post("/api/meal-plan/validate", json=invalid_plan)
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["valid"] is False
-        assert len(data["errors"]) > 0
-
-    def test_validate_meal_plan_with_empty_person_dates(self, api_client):
-        """Test validation error when person has empty eating dates list."""
-        invalid_plan = {
-            "scheduled_meals": [
-                {
-                    "id": "sm_1",
-                    "meal_id": "test_spaghetti",
-                    "cooking_dates": ["2026-01-10"],
-                    "eating_dates_per_person": {"John": []},  # Empty list
+                    "eating_dates_per_person": eating_dates_per_person,
                     "meal_type": "dinner",
                     "assigned_cook": "John",
                 }
@@ -2,8 +2,13 @@
 API tests for meals endpoints.
 """
 
+import asyncio
+
 import pytest
 
+_MEAL_REQUIRED_FIELDS = frozenset({"meal_id", "name", "ingredients", "base_servings"})
+_INGREDIENT_REQUIRED_FIELDS = frozenset({"name", "quantity", "unit", "category"})
+
 
 @pytest.mark.api
 class TestMealsAPI:
@@ -32,10 +37,12 @@ class TestMealsAPI:
         meal_names = [m["name"].lower() for m in data["meals"]]
         assert any("spaghetti" in name for name in meal_names)
 
-    def test_get_meals_search_case_insensitive(self, api_client):
+    async def test_get_meals_search_case_insensitive(self, async_client):
         """Test search is case-insensitive."""
-        response1 = api_client.get("/api/meals?search=SPAGHETTI")
-        response2 = api_client.get("/api/meals?search=spaghetti")
+        response1, response2 = await asyncio.gather(
+            async_client.get("/api/meals?search=SPAGHETTI"),
+            async_client.get("/api/meals?search=spaghetti"),
+        )
 
         assert response1.status_code == 200
         assert response2.status_code == 200
@@ -91,10 +98,7 @@ class TestMealsAPI:
         data = response.json()
 
         for meal in data["meals"]:
-            assert "meal_id" in meal
-            assert "name" in meal
-            assert "ingredients" in meal
-            assert "base_servings" in meal
+            assert not _MEAL_REQUIRED_FIELDS - meal.keys()
             assert isinstance(meal["ingredients"], list)
             assert isinstance(meal["base_servings"], dict)
 
@@ -104,10 +108,7 @@ class TestMealsAPI:
         meal = response.json()
 
         for ingredient in meal["ingredients"]:
-            assert "name" in ingredient
-            assert "quantity" in ingredient
-            assert "unit" in ingredient
-            assert "category" in ingredient
+            assert not _INGREDIENT_REQUIRED_FIELDS - ingredient.keys()
 
     def test_base_servings_structure(self, api_client):
         """Test base_servings have correct structure."""
@@ -120,79 +121,20 @@ class TestMealsAPI:
         assert isinstance(base_servings["high_calorie"], (int, float))
         assert isinstance(base_servings["low_calorie"], (int, float))
 
-    def test_get_meals_database_not_found(self, api_client, monkeypatch):
-        """Test error when meals database file doesn't exist."""
-        import sys
-
-        # Clear cached imports
-        for module in list(sys.modules.keys()):
-            if module.startswith("backend"):
-                del sys.modules[module]
-
-        monkeypatch.setattr("backend.routers.meals.MEALS_DB_PATH", "/nonexistent/path.json")
-
-        from fastapi.testclient import TestClient
-
-        from backend.main import app
-
-        client = TestClient(app)
-
-        response = client.get("/api/meals/")
-
-        assert response.status_code == 500
-        assert "not found" in response.json()["detail"].lower()
-
-    def test_get_meals_invalid_json(self, api_client, tmp_path, monkeypatch):
-        """Test error when meals database has invalid JSON."""
-        import sys
-
-        # Clear cached imports
-        for module in list(sys.modules.keys()):
-            if module.startswith("backend"):
-                del sys.modules[module]
-
-        # Create invalid JSON file
-        invalid_db = tmp_path / "invalid.json"
-        with open(invalid_db, "w") as f:
-            f.write("{invalid json")
-
-        monkeypatch.setattr("backend.routers.meals.MEALS_DB_PATH", str(invalid_db))
-
-        from fastapi.testclient import TestClient
-
-        from backend.main import app
-
-        client = TestClient(app)
-
-        response = client.get("/api/meals/")
-
-        assert response.status_code == 500
-        assert "parsing" in response.json()["detail"].lower()
-
-    def test_get_ingredient_calories_missing(self, api_client, tmp_path, monkeypatch):
-        """Test error when ingredient_details not in database."""
-        import json
-        import sys
-
-        # Clear cached imports
-        for module in list(sys.modules.keys()):
-            if module.startswith("backend"):
-                del sys.modules[module]
-
-        # Create database without ingredient_details
-        db_path = tmp_path / "no_details.json"
-        with open(db_path, "w") as f:
-            json.dump({"meals": []}, f)
-
-        monkeypatch.setattr("backend.routers.meals.MEALS_DB_PATH", str(db_path))
-
-        from fastapi.testclient import TestClient
-
-        from backend.main import app
-
-        client = TestClient(app)
-
-        response = client.get("/api/meals/ingredient-details")
+    @pytest.mark.parametrize(
+        "db_contents,endpoint,expected_detail",
+        [
+            (None, "/api/meals/", "not found"),
+            ("{invalid json", "/api/meals/", "parsing"),
+            ('{"meals": []}', "/api/meals/ingredient-details", "ingredient_details not found"),
+        ],
+        ids=["database-not-found", "invalid-json", "ingredient-details-missing"],
+    )
+    def test_get_meals_database_errors(self, broken_meals_db_client, db_contents, endpoint, expected_detail):
+        """Test server error when the meals database is missing, invalid or lacks ingredient_details."""
+        client = broken_meals_db_client(db_contents)
+
+        response = client.get(endpoint)
 
         assert response.status_code == 500
-        assert "ingredient_details not found" in response.json()["detail"]
+        assert expected_detail in response.json()["detail"]
@@ -4,15 +4,18 @@ API tests for task generation endpoints.
 
 import pytest
 
+from backend.routers import tasks as tasks_router
+
 
 @pytest.mark.api
+@pytest.mark.usefixtures("class_env_token")
 class TestTasksAPI:
     """Tests for /api/tasks endpoints."""
 
-    def test_generate_tasks_success(self, api_client, sample_meal_plan, mock_env_token, mocker):
+    def test_generate_tasks_success(self, api_client, sample_meal_plan, mocker):
         """Test POST /api/tasks/generate successfully creates tasks."""
         # Mock the TodoistAdapter where it's imported in tasks router
-        mock_adapter = mocker.patch("backend.routers.tasks.TodoistAdapter")
+        mock_adapter = mocker.patch.object(tasks_router, "TodoistAdapter")
         mock_instance = mock_adapter.return_value
         mock_instance.create_tasks.return_value = []  # Returns list of created tasks
 
@@ -27,7 +30,7 @@ class TestTasksAPI:
 
     def test_generate_tasks_with_custom_token(self, api_client, sample_meal_plan, mocker):
         """Test generating tasks with custom token."""
-        mock_adapter = mocker.patch("backend.routers.tasks.TodoistAdapter")
+        mock_adapter = mocker.patch.object(tasks_router, "TodoistAdapter")
         mock_instance = mock_adapter.return_value
         mock_instance.create_tasks.return_value = []  # Returns list of created tasks
 
@@ -52,7 +55,7 @@ class TestTasksAPI:
         data = response.json()
         assert "token" in data["detail"].lower()
 
-    def test_generate_tasks_invalid_meal_plan(self, api_client, mock_env_token):
+    def test_generate_tasks_invalid_meal_plan(self, api_client):
         """Test generating tasks with invalid meal plan."""
         invalid_plan = {
             "scheduled_meals": [
@@ -71,12 +74,12 @@ class TestTasksAPI:
         response = api_client.post("/api/tasks/generate", json={"meal_plan": invalid_plan, "todoist_token": "env"})
 
         # Should return error about validation or missing meal
-        assert response.status_code in [400, 404, 422]
+        assert response.status_code in {400, 404, 422}
 
-    def test_generate_tasks_validation_error(self, api_client, mock_env_token, mocker):
+    def test_generate_tasks_validation_error(self, api_client, mocker):
         """Test generating tasks with invalid meal plan (eating before cooking)."""
         # Mock TodoistAdapter (won't be called due to validation error)
-        mock_adapter = mocker.patch("backend.routers.tasks.TodoistAdapter")
+        mock_adapter = mocker.patch.object(tasks_router, "TodoistAdapter")
         mock_instance = mock_adapter.return_value
         mock_instance.create_tasks.return_value = []
 
@@ -102,7 +105,7 @@ class TestTasksAPI:
         data = response.json()
         assert "validation_errors" in data["detail"]
 
-    def test_config_status_with_env_token(self, api_client, mock_env_token):
+    def test_config_status_with_env_token(self, api_client):
         """Test GET /api/config/status with environment token."""
         response = api_client.get("/api/config/status")
 
@@ -149,9 +152,9 @@ class TestTasksAPI:
         assert data["diet_profiles"]["John"] == "high_calorie"
         assert data["diet_profiles"]["Jane"] == "low_calorie"
 
-    def test_generate_tasks_with_custom_config(self, api_client, sample_meal_plan, mock_env_token, mocker):
+    def test_generate_tasks_with_custom_config(self, api_client, sample_meal_plan, mocker):
         """Test task generation with enable_ingredient_rounding flag."""
-        mock_adapter = mocker.patch("backend.routers.tasks.TodoistAdapter")
+        mock_adapter = mocker.patch.object(tasks_router, "TodoistAdapter")
         mock_instance = mock_adapter.return_value
         mock_instance.create_tasks.return_value = []
 
@@ -166,11 +169,9 @@ class TestTasksAPI:
         call_args = mock_adapter.call_args
         assert call_args[0][1].enable_ingredient_rounding == False
 
-    def test_generate_tasks_with_no_config_file(
-        self, api_client, sample_meal_plan, mock_env_token, mocker, tmp_path, monkeypatch
-    ):
+    def test_generate_tasks_with_no_config_file(self, api_client, sample_meal_plan, mocker, tmp_path, monkeypatch):
         """Test task generation when no config file exists (uses defaults)."""
-        mock_adapter = mocker.patch("backend.routers.tasks.TodoistAdapter")
+        mock_adapter = mocker.patch.object(tasks_router, "TodoistAdapter")
         mock_instance = mock_adapter.return_value
         mock_instance.create_tasks.return_value = []
 
@@ -184,22 +185,9 @@ class TestTasksAPI:
         call_args = mock_adapter.call_args
         assert call_args[0][1] is not None
 
-    def test_generate_tasks_meals_db_not_found(self, api_client, sample_meal_plan, mock_env_token, mocker, monkeypatch):
+    def test_generate_tasks_meals_db_not_found(self, broken_meals_db_client, sample_meal_plan):
         """Test error when meals database doesn't exist."""
-        import sys
-
-        # Clear cached imports
-        for module in list(sys.modules.keys()):
-            if module.startswith("backend.routers.tasks"):
-                del sys.modules[module]
-
-        monkeypatch.setattr("backend.routers.tasks.MEALS_DB_PATH", "/nonexistent/meals.json")
-
-        from fastapi.testclient import TestClient
-
-        from backend.main import app
-
-        client = TestClient(app)
+        client = broken_meals_db_client()
 
         response = client.post(
             "/api/tasks/generate",
@@ -4,152 +4,179 @@ Shared pytest fixtures for Recipier tests.
 
 import json
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from unittest.mock import MagicMock
 
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 
+from backend.config_loader import _config_loader as _CONFIG_LOADER
+from backend.main import app as _APP
 from recipier.config import TaskConfig
 from recipier.localization import Localizer
+from recipier.meal_planner import MealPlanner
 
 # ============================================================================
 # Test Data Fixtures
 # ============================================================================
-
-
-@pytest.fixture
+# Sample data fixtures are session-scoped and shared between tests: treat them as read-only
+# and deepcopy before mutating.
+
+_SAMPLE_MEALS_DB: Dict[str, Any] = {
+    "meals": [
+        {
+            "meal_id": "test_spaghetti",
+            "name": "Test Spaghetti Carbonara",
+            "base_servings": {"high_calorie": 1.67, "low_calorie": 1.0},
+            "ingredients": [
+                {"name": "spaghetti", "quantity": 100, "unit": "g", "category": "pantry"},
+                {"name": "bacon", "quantity": 50, "unit": "g", "category": "meat"},
+                {"name": "eggs", "quantity": 2, "unit": "pcs", "category": "dairy"},
+            ],
+            "prep_tasks": [],
+        },
+        {
+            "meal_id": "test_salad",
+            "name": "Test Caesar Salad",
+            "base_servings": {"high_calorie": 1.5, "low_calorie": 1.0},
+            "ingredients": [
+                {"name": "lettuce", "quantity": 100, "unit": "g", "category": "produce"},
+                {"name": "chicken breast", "quantity": 80, "unit": "g", "category": "meat"},
+            ],
+            "prep_tasks": [{"description": "Wash and chop lettuce", "days_before": 1}],
+        },
+    ],
+    "ingredient_details": {
+        "spaghetti": {"calories_per_100g": 371, "unit_size": None, "adjustable": True},
+        "bacon": {"calories_per_100g": 541, "unit_size": None, "adjustable": True},
+        "eggs": {"calories_per_100g": 155, "unit_size": None, "adjustable": True},
+        "lettuce": {"calories_per_100g": 15, "unit_size": None, "adjustable": True},
+        "chicken breast": {"calories_per_100g": 165, "unit_size": None, "adjustable": True},
+    },
+}
+# Serialized once; file fixtures write these bytes instead of re-encoding the dicts per test
+_SAMPLE_MEALS_DB_BYTES = json.dumps(_SAMPLE_MEALS_DB).encode()
+
+
+@pytest.fixture(scope="session")
 def sample_meals_database() -> Dict[str, Any]:
     """Sample meals database for testing."""
-    return {
-        "meals": [
-            {
-                "meal_id": "test_spaghetti",
-                "name": "Test Spaghetti Carbonara",
-                "base_servings": {"high_calorie": 1.67, "low_calorie": 1.0},
-                "ingredients": [
-                    {"name": "spaghetti", "quantity": 100, "unit": "g", "category": "pantry"},
-                    {"name": "bacon", "quantity": 50, "unit": "g", "category": "meat"},
-                    {"name": "eggs", "quantity": 2, "unit": "pcs", "category": "dairy"},
-                ],
-                "prep_tasks": [],
+    return _SAMPLE_MEALS_DB
+
+
+_SAMPLE_MEAL_PLAN: Dict[str, Any] = {
+    "scheduled_meals": [
+        {
+            "id": "sm_1704067200000",
+            "meal_id": "test_spaghetti",
+            "cooking_dates": ["2026-01-06", "2026-01-07"],  # Multiple cooking dates
+            "eating_dates_per_person": {
+                "John": ["2026-01-06", "2026-01-07"],  # Eats on both days
+                "Jane": ["2026-01-06"],  # Eats on first day only
             },
-            {
-                "meal_id": "test_salad",
-                "name": "Test Caesar Salad",
-                "base_servings": {"high_calorie": 1.5, "low_calorie": 1.0},
-                "ingredients": [
-                    {"name": "lettuce", "quantity": 100, "unit": "g", "category": "produce"},
-                    {"name": "chicken breast", "quantity": 80, "unit": "g", "category": "meat"},
-                ],
-                "prep_tasks": [{"description": "Wash and chop lettuce", "days_before": 1}],
+            "meal_type": "dinner",
+            "assigned_cook": "John",
+        },
+        {
+            "id": "sm_1704153600000",
+            "meal_id": "test_salad",
+            "cooking_dates": ["2026-01-07", "2026-01-08"],
+            "eating_dates_per_person": {
+                "John": ["2026-01-07", "2026-01-08"],
+                "Jane": ["2026-01-07", "2026-01-08"],
             },
-        ],
-        "ingredient_details": {
-            "spaghetti": {"calories_per_100g": 371, "unit_size": None, "adjustable": True},
-            "bacon": {"calories_per_100g": 541, "unit_size": None, "adjustable": True},
-            "eggs": {"calories_per_100g": 155, "unit_size": None, "adjustable": True},
-            "lettuce": {"calories_per_100g": 15, "unit_size": None, "adjustable": True},
-            "chicken breast": {"calories_per_100g": 165, "unit_size": None, "adjustable": True},
+            "meal_type": "dinner",
+            "assigned_cook": "Jane",
         },
-    }
-
-
-@pytest.fixture
+    ],
+    "shopping_trips": [
+        {
+            "shopping_date": "2026-01-05",
+            "scheduled_meal_ids": ["sm_1704067200000", "sm_1704153600000"],
+        }
+    ],
+}
+_SAMPLE_MEAL_PLAN_BYTES = json.dumps(_SAMPLE_MEAL_PLAN).encode()
+
+
+@pytest.fixture(scope="session")
 def sample_meal_plan() -> Dict[str, Any]:
     """Sample meal plan for testing."""
-    return {
-        "scheduled_meals": [
-            {
-                "id": "sm_1704067200000",
-                "meal_id": "test_spaghetti",
-                "cooking_dates": ["2026-01-06", "2026-01-07"],  # Multiple cooking dates
-                "eating_dates_per_person": {
-                    "John": ["2026-01-06", "2026-01-07"],  # Eats on both days
-                    "Jane": ["2026-01-06"],  # Eats on first day only
-                },
-                "meal_type": "dinner",
-                "assigned_cook": "John",
-            },
-            {
-                "id": "sm_1704153600000",
-                "meal_id": "test_salad",
-                "cooking_dates": ["2026-01-07", "2026-01-08"],
-                "eating_dates_per_person": {
-                    "John": ["2026-01-07", "2026-01-08"],
-                    "Jane": ["2026-01-07", "2026-01-08"],
-                },
-                "meal_type": "dinner",
-                "assigned_cook": "Jane",
-            },
-        ],
-        "shopping_trips": [
-            {
-                "shopping_date": "2026-01-05",
-                "scheduled_meal_ids": ["sm_1704067200000", "sm_1704153600000"],
-            }
-        ],
-    }
-
-
-@pytest.fixture
+    return _SAMPLE_MEAL_PLAN
+
+
+_SAMPLE_CONFIG = TaskConfig(
+    shopping_categories=[
+        "produce",
+        "meat",
+        "dairy",
+        "pantry",
+        "frozen",
+        "bakery",
+        "beverages",
+        "spices",
+        "other",
+    ],
+    use_emojis=True,
+    use_category_labels=True,
+    ingredient_format="{quantity}{unit} {name}",
+    shopping_priority=2,
+    prep_priority=2,
+    cooking_priority=3,
+    serving_priority=3,
+    project_name="Test Meal Planning",
+    user_mapping={"John": "John Doe", "Jane": "Jane Doe"},
+    diet_profiles={"John": "high_calorie", "Jane": "low_calorie"},
+    use_sections=True,
+    shopping_section_name="Shopping",
+    prep_section_name="Prep",
+    cooking_section_name="Cooking",
+    eating_section_name="Serving",
+    language="english",
+)
+_SAMPLE_CONFIG_BYTES = _SAMPLE_CONFIG.model_dump_json(indent=2).encode()
+
+
+@pytest.fixture(scope="session")
 def sample_config() -> TaskConfig:
     """Sample configuration for testing."""
-    return TaskConfig(
-        shopping_categories=[
-            "produce",
-            "meat",
-            "dairy",
-            "pantry",
-            "frozen",
-            "bakery",
-            "beverages",
-            "spices",
-            "other",
-        ],
-        use_emojis=True,
-        use_category_labels=True,
-        ingredient_format="{quantity}{unit} {name}",
-        shopping_priority=2,
-        prep_priority=2,
-        cooking_priority=3,
-        serving_priority=3,
-        project_name="Test Meal Planning",
-        user_mapping={"John": "John Doe", "Jane": "Jane Doe"},
-        diet_profiles={"John": "high_calorie", "Jane": "low_calorie"},
-        use_sections=True,
-        shopping_section_name="Shopping",
-        prep_section_name="Prep",
-        cooking_section_name="Cooking",
-        eating_section_name="Serving",
-        language="english",
-    )
+    return _SAMPLE_CONFIG
 
 
-@pytest.fixture
-def temp_meals_database(tmp_path, sample_meals_database):
+@pytest.fixture(scope="session")
+def default_config() -> TaskConfig:
+    """TaskConfig with all defaults."""
+    return TaskConfig()
+
+
+@pytest.fixture(scope="session")
+def temp_data_dir(tmp_path_factory):
+    """Directory holding the session's read-only sample data files."""
+    return tmp_path_factory.mktemp("data")
+
+
+@pytest.fixture(scope="session")
+def temp_meals_database(temp_data_dir):
     """Create temporary meals database file."""
-    db_path = tmp_path / "test_meals_database.json"
-    with open(db_path, "w") as f:
-        json.dump(sample_meals_database, f)
+    db_path = temp_data_dir / "test_meals_database.json"
+    db_path.write_bytes(_SAMPLE_MEALS_DB_BYTES)
     return db_path
 
 
-@pytest.fixture
-def temp_meal_plan(tmp_path, sample_meal_plan):
+@pytest.fixture(scope="session")
+def temp_meal_plan(temp_data_dir):
     """Create temporary meal plan file."""
-    plan_path = tmp_path / "test_meal_plan.json"
-    with open(plan_path, "w") as f:
-        json.dump(sample_meal_plan, f)
+    plan_path = temp_data_dir / "test_meal_plan.json"
+    plan_path.write_bytes(_SAMPLE_MEAL_PLAN_BYTES)
     return plan_path
 
 
-@pytest.fixture
-def temp_config(tmp_path, sample_config):
+@pytest.fixture(scope="session")
+def temp_config(temp_data_dir):
     """Create temporary config file."""
-    config_path = tmp_path / "test_config.json"
-    with open(config_path, "w") as f:
-        json.dump(sample_config.__dict__, f)
+    config_path = temp_data_dir / "test_config.json"
+    config_path.write_bytes(_SAMPLE_CONFIG_BYTES)
     return config_path
 
 
@@ -158,18 +185,124 @@ def temp_config(tmp_path, sample_config):
 # ============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def localizer_english() -> Localizer:
     """English localizer instance."""
     return Localizer(language="english")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def localizer_polish() -> Localizer:
     """Polish localizer instance."""
     return Localizer(language="polish")
 
 
+@pytest.fixture(scope="session")
+def localizer(sample_config) -> Localizer:
+    """Localizer for the sample config's language."""
+    return Localizer(sample_config.language)
+
+
+@pytest.fixture(scope="module")
+def planner(sample_config, sample_meals_database) -> MealPlanner:
+    """MealPlanner for the sample config and database, shared by the tests of a module."""
+    return MealPlanner(sample_config, sample_meals_database)
+
+
+@pytest.fixture(scope="module")
+def expanded_sample_plan(planner, sample_meal_plan) -> Dict[str, Any]:
+    """Sample meal plan expanded by the shared planner (read-only; deepcopy before rounding it)."""
+    return planner.expand_meal_plan(sample_meal_plan)
+
+
+@pytest.fixture(scope="module")
+def expanded_ingredients_by_name(expanded_sample_plan) -> Dict[str, Dict[str, Any]]:
+    """Ingredients of the first expanded sample meal (spaghetti carbonara), keyed by name."""
+    return {ing["name"]: ing for ing in expanded_sample_plan["meals"][0]["ingredients"]}
+
+
+_RECIPE_MEALS_DB: Dict[str, Any] = {
+    "meals": [
+        {
+            "meal_id": "test_spaghetti",
+            "name": "Test Spaghetti",
+            "base_servings": {"high_calorie": 1.67, "low_calorie": 1.0},
+            "ingredients": [
+                {"name": "spaghetti", "quantity": 100, "unit": "g", "category": "pantry"},
+                {"name": "tomato", "quantity": 50, "unit": "g", "category": "produce"},
+            ],
+            "steps": [
+                "Boil water in a large pot",
+                "Cook pasta according to package instructions",
+                "Mix eggs and cheese in a bowl",
+                "Combine pasta with egg mixture",
+            ],
+            "suggested_seasonings": "salt, pepper, basil",
+        },
+        {
+            "meal_id": "test_salad",
+            "name": "Test Salad",
+            "base_servings": {"high_calorie": 1.5, "low_calorie": 1.0},
+            "ingredients": [
+                {"name": "lettuce", "quantity": 100, "unit": "g", "category": "produce"},
+            ],
+            "suggested_seasonings": "salt, olive oil, lemon juice",
+        },
+        {
+            "meal_id": "test_pasta",
+            "name": "Test Pasta",
+            "base_servings": {"high_calorie": 1.5, "low_calorie": 1.0},
+            "ingredients": [
+                {"name": "pasta", "quantity": 100, "unit": "g", "category": "pantry"},
+            ],
+            "suggested_seasonings": "salt, pepper, oregano",  # salt and pepper overlap
+        },
+    ],
+    "ingredient_calories": {"spaghetti": 371, "tomato": 18, "lettuce": 15, "pasta": 371},
+}
+
+
+@pytest.fixture(scope="module")
+def recipe_planner(sample_config) -> MealPlanner:
+    """MealPlanner for meals with cooking steps and overlapping suggested seasonings."""
+    return MealPlanner(sample_config, _RECIPE_MEALS_DB)
+
+
+@pytest.fixture(scope="module")
+def seasoning_shopping_task(recipe_planner):
+    """Shopping task for one trip buying all three recipe meals."""
+    planner = recipe_planner
+    plan = {
+        "scheduled_meals": [
+            {
+                "id": f"sm_{i}",
+                "meal_id": meal_id,
+                "cooking_dates": [date],
+                "eating_dates_per_person": {person: [date]},
+                "meal_type": "dinner",
+                "assigned_cook": person,
+            }
+            for i, (meal_id, date, person) in enumerate(
+                [
+                    ("test_spaghetti", "2026-01-06", "John"),
+                    ("test_salad", "2026-01-07", "Jane"),
+                    ("test_pasta", "2026-01-08", "Jane"),
+                ],
+                1,
+            )
+        ],
+        "shopping_trips": [{"shopping_date": "2026-01-05", "scheduled_meal_ids": ["sm_1", "sm_2", "sm_3"]}],
+    }
+    return planner.create_shopping_tasks(planner.expand_meal_plan(plan))[0]
+
+
+@pytest.fixture(scope="module")
+def seasoning_subtasks(seasoning_shopping_task, localizer):
+    """Seasoning subtasks of the recipe shopping task."""
+    seasoning_note = localizer.t("seasoning_note")
+    return [st for st in seasoning_shopping_task.subtasks if seasoning_note in st.title]
+
+
 @pytest.fixture
 def mock_todoist_adapter(mocker):
     """Mock TodoistAdapter for testing."""
@@ -185,57 +318,114 @@ def mock_todoist_adapter(mocker):
     return mock_adapter
 
 
+@pytest.fixture(scope="session")
+def todoist_api_objects() -> Dict[str, Any]:
+    """
+    Project, section and task objects returned by a mocked TodoistAPI, built once per session.
+    Treat them as read-only; the adapter only reads their attributes.
+    """
+    project = MagicMock()
+    project.id = "project_123"
+    project.name = "Test Meal Planning"
+
+    sections = []
+    for section_id, section_name in [
+        ("section_shopping", "Shopping"),
+        ("section_prep", "Prep"),
+        ("section_cooking", "Cooking"),
+        ("section_serving", "Serving"),
+    ]:
+        section = MagicMock()
+        section.id = section_id
+        section.name = section_name
+        section.project_id = "project_123"
+        sections.append(section)
+
+    task = MagicMock()
+    task.id = "task_123"
+
+    return {"project": project, "sections": sections, "task": task}
+
+
 # ============================================================================
 # API Test Fixtures
 # ============================================================================
 
 
-@pytest.fixture
-def api_client(tmp_path, sample_meals_database, sample_config, monkeypatch):
-    """FastAPI test client with test database and config."""
-    # Create test meals database
-    db_path = tmp_path / "meals_database.json"
-    with open(db_path, "w") as f:
-        json.dump(sample_meals_database, f)
-
-    # Create test config file
-    config_path = tmp_path / "my_config.json"
-    sample_config.to_file(str(config_path))
+@pytest.fixture(scope="session")
+def backend_app(tmp_path_factory):
+    """Shared FastAPI app, reading a test meals database written once per session."""
+    db_path = tmp_path_factory.mktemp("api") / "meals_database.json"
+    db_path.write_bytes(_SAMPLE_MEALS_DB_BYTES)
 
-    # Clear any cached imports and config cache
-    import sys
+    with pytest.MonkeyPatch.context() as mp:
+        # tasks binds MEALS_DB_PATH at import time, so it is patched separately
+        mp.setattr("backend.routers.meals.MEALS_DB_PATH", str(db_path))
+        mp.setattr("backend.routers.tasks.MEALS_DB_PATH", str(db_path))
+        yield _APP
 
-    for module in list(sys.modules.keys()):
-        if module.startswith("backend"):
-            del sys.modules[module]
 
-    # Change to tmp directory so my_config.json is found
-    import os
+@pytest.fixture(scope="session")
+def backend_client(backend_app):
+    """
+    Shared FastAPI test client.
+    Entering the client runs app startup once and keeps its event loop running between tests.
+    """
+    with TestClient(backend_app) as client:
+        yield client
 
-    original_dir = os.getcwd()
-    os.chdir(tmp_path)
 
-    # Override the MEALS_DB_PATH before importing
-    monkeypatch.setattr("backend.routers.meals.MEALS_DB_PATH", str(db_path))
+@pytest.fixture
+def api_config(tmp_path, monkeypatch):
+    """Test config file in tmp_path, made the working directory so my_config.json is found."""
+    (tmp_path / "my_config.json").write_bytes(_SAMPLE_CONFIG_BYTES)
+    monkeypatch.chdir(tmp_path)
 
     # Clear config cache
-    from backend.config_loader import ConfigLoader
+    monkeypatch.setattr(_CONFIG_LOADER, "_config", None)
+
+
+@pytest.fixture
+def api_client(backend_client, api_config):
+    """FastAPI test client with test database and config."""
+    return backend_client
 
-    ConfigLoader._instance = None
-    ConfigLoader._config = None
 
-    # Import and create test client
-    from backend.main import app
+@pytest.fixture
+def broken_meals_db_client(api_client, tmp_path, monkeypatch):
+    """
+    Factory pointing the API at a broken meals database and returning the test client.
+    Pass the file contents, or None for a missing database file.
+    """
+
+    def make(contents: Optional[str] = None) -> TestClient:
+        db_path = tmp_path / "broken_meals_database.json"
+        if contents is not None:
+            db_path.write_text(contents)
+        monkeypatch.setattr("backend.routers.meals.MEALS_DB_PATH", str(db_path))
+        monkeypatch.setattr("backend.routers.tasks.MEALS_DB_PATH", str(db_path))
+        return api_client
 
-    client = TestClient(app)
+    return make
 
-    yield client
 
-    # Restore original directory
-    os.chdir(original_dir)
+@pytest.fixture
+async def async_client(backend_app, api_config):
+    """Async FastAPI test client, for tests that issue several requests concurrently."""
+    transport = httpx.ASGITransport(app=backend_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test", follow_redirects=True) as client:
+        yield client
 
 
 @pytest.fixture
 def mock_env_token(monkeypatch):
     """Mock TODOIST_API_TOKEN environment variable."""
     monkeypatch.setenv("TODOIST_API_TOKEN", "test_token_123")
+
+
+@pytest.fixture(scope="class")
+def class_env_token():
+    """TODOIST_API_TOKEN set once for a whole test class; tests can still delenv it with monkeypatch."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("TODOIST_API_TOKEN", "test_token_123")
+        yield
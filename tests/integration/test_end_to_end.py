@@ -2,110 +2,131 @@
 Integration tests for end-to-end workflows.
 """
 
-import json
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import pytest
 
+from backend.routers.meal_plans import MealPlanRequest, find_meal_plan_errors
+from recipier.localization import Localizer
+from recipier.meal_planner import Task
+from recipier.todoist_adapter import TodoistAdapter, configure_cli_logging
+
 
 @pytest.mark.integration
 class TestEndToEndWorkflow:
     """End-to-end integration tests."""
 
     def test_full_meal_plan_to_tasks_workflow(
-        self, tmp_path, sample_meals_database, sample_meal_plan, sample_config, mocker
+        self, planner, sample_meal_plan, sample_config, todoist_api_objects, mocker
     ):
         """Test complete workflow from meal plan to Todoist tasks."""
-        # Clear cached recipier modules to ensure clean imports
-        import sys
-
-        for module in list(sys.modules.keys()):
-            if module.startswith("recipier"):
-                del sys.modules[module]
-
-        # Setup: Create temporary files
-        meals_db_path = tmp_path / "meals.json"
-        meal_plan_path = tmp_path / "plan.json"
-        config_path = tmp_path / "config.json"
-
-        with open(meals_db_path, "w") as f:
-            json.dump(sample_meals_database, f)
-
-        with open(meal_plan_path, "w") as f:
-            json.dump(sample_meal_plan, f)
-
-        with open(config_path, "w") as f:
-            json.dump(sample_config.model_dump(), f)
-
-        # Mock Todoist API
-        mock_api = mocker.patch("todoist_api_python.api.TodoistAPI")
+        # Mock Todoist API where the adapter looks it up
+        mock_api = mocker.patch("recipier.todoist_adapter.TodoistAPI")
         mock_instance = mock_api.return_value
 
-        # Create mock objects with attributes (not dicts)
-        from unittest.mock import MagicMock
-
-        mock_project = MagicMock()
-        mock_project.id = "project_123"
-        mock_project.name = "Test Meal Planning"
-
-        mock_sections = []
-        for section_id, section_name in [
-            ("section_shopping", "Shopping"),
-            ("section_prep", "Prep"),
-            ("section_cooking", "Cooking"),
-            ("section_serving", "Serving"),
-        ]:
-            mock_section = MagicMock()
-            mock_section.id = section_id
-            mock_section.name = section_name
-            mock_section.project_id = "project_123"
-            mock_sections.append(mock_section)
-
-        mock_task = MagicMock()
-        mock_task.id = "task_123"
-
         # Mock API methods
-        mock_instance.get_projects.return_value = [mock_project]
-        mock_instance.get_sections.return_value = mock_sections
-        mock_instance.add_task.return_value = mock_task
-        mock_instance.add_project.return_value = mock_project
-
-        # Execute: Load and process meal plan
-        from recipier.config import TaskConfig
-        from recipier.meal_planner import MealPlanner
-        from recipier.todoist_adapter import TodoistAdapter
-
-        config = TaskConfig.from_file(str(config_path))
-
-        with open(meals_db_path, "r") as f:
-            meals_db = json.load(f)
-
-        with open(meal_plan_path, "r") as f:
-            meal_plan = json.load(f)
-
-        # Create planner and generate tasks
-        planner = MealPlanner(config, meals_db)
+        mock_instance.get_projects.return_value = [todoist_api_objects["project"]]
+        mock_instance.get_sections.return_value = todoist_api_objects["sections"]
+        mock_instance.add_task.return_value = todoist_api_objects["task"]
+        mock_instance.add_project.return_value = todoist_api_objects["project"]
+        john = mocker.Mock(id="user_john")
+        john.name = "John Doe"  # name is a Mock constructor argument, so set it afterwards
+        mock_instance.get_collaborators.return_value = [[john]]  # One page of collaborators
+
+        # Execute: Process meal plan (file loading is covered by test_load_meal_plan and the config tests)
         # generate_all_tasks handles expansion internally
-        tasks = planner.generate_all_tasks(meal_plan)
+        tasks = planner.generate_all_tasks(sample_meal_plan)
 
         # Verify: Tasks were generated
         assert len(tasks) > 0
 
         # Verify: Task types
-        task_types = {task.task_type for task in tasks}
-        assert "shopping" in task_types
-        assert "cooking" in task_types
+        assert any(task.task_type == "shopping" for task in tasks)
+        assert any(task.task_type == "cooking" for task in tasks)
 
         # Execute: Create tasks in Todoist
-        adapter = TodoistAdapter("fake_token", config)
+        todoist_config = sample_config.todoist.model_copy(update={"user_mapping": {"John": "John Doe"}})
+        adapter = TodoistAdapter("fake_token", sample_config.model_copy(update={"todoist": todoist_config}))
         adapter.create_tasks(tasks)
 
         # Verify: Todoist API was called
+        mock_instance.get_collaborators.assert_called_once_with(project_id="project_123")
+        assert any(call.kwargs.get("assignee_id") == "user_john" for call in mock_instance.add_task.call_args_list)
         assert mock_instance.add_task.called
         assert mock_instance.add_task.call_count >= len(tasks)
 
+    def test_create_tasks_stops_on_subtask_failure(self, sample_config, todoist_api_objects, mocker):
+        """Test a failing subtask stops task creation and the error reaches the caller."""
+        mock_instance = mocker.patch("recipier.todoist_adapter.TodoistAPI").return_value
+        mock_instance.get_projects.return_value = [todoist_api_objects["project"]]
+        mock_instance.get_sections.return_value = todoist_api_objects["sections"]
+        mock_instance.get_collaborators.return_value = [[]]
+
+        def add_task(**params):
+            if params["content"] == "broken":
+                raise RuntimeError("Todoist is down")
+            return todoist_api_objects["task"]
+
+        mock_instance.add_task.side_effect = add_task
+
+        # Run subtask lists inline so the failure is already recorded when the next parent is due
+        class InlineExecutor(ThreadPoolExecutor):
+            def submit(self, fn, *args, **kwargs):
+                future = Future()
+                try:
+                    future.set_result(fn(*args, **kwargs))
+                except Exception as exc:
+                    future.set_exception(exc)
+                return future
+
+        mocker.patch("recipier.todoist_adapter.ThreadPoolExecutor", InlineExecutor)
+
+        def task(title, subtasks=()):
+            return Task(title=title, description="", priority=4, assigned_to="", subtasks=subtasks)
+
+        tasks = [
+            task("first", [task("broken"), task("never")]),
+            task("second", [task("also never")]),
+        ]
+        adapter = TodoistAdapter("fake_token", sample_config)
+
+        with pytest.raises(RuntimeError, match="Todoist is down"):
+            adapter.create_tasks(tasks)
+
+        assert [call.kwargs["content"] for call in mock_instance.add_task.call_args_list] == ["first", "broken"]
+
+    def test_cli_logging_prints_adapter_messages(self, sample_config, mocker, capsys):
+        """Test the CLI logging setup prints adapter progress and prefixed warnings to stdout."""
+        mock_instance = mocker.patch("recipier.todoist_adapter.TodoistAPI").return_value
+        project = mocker.Mock(id="project_123")
+        project.name = sample_config.todoist.project_name  # name is a Mock constructor argument
+        mock_instance.get_projects.return_value = [project]
+        mock_instance.get_collaborators.side_effect = RuntimeError("no access")
+        # The CLIs run without root handlers; the backend's would echo every message again here
+        mocker.patch.object(logging.getLogger(), "handlers", [])
+
+        recipier_logger = logging.getLogger("recipier")
+        handlers, level = list(recipier_logger.handlers), recipier_logger.level
+        try:
+            configure_cli_logging()
+            configure_cli_logging()  # Calling it again must not print everything twice
+
+            adapter = TodoistAdapter("fake_token", sample_config)
+            adapter.get_or_create_project()
+            adapter.get_user_ids()
+        finally:
+            recipier_logger.handlers[:] = handlers
+            recipier_logger.setLevel(level)
+
+        assert capsys.readouterr().out.splitlines() == [
+            f"✓ Using existing project: {sample_config.todoist.project_name}",
+            "Warning: Could not fetch user ids: no access",
+        ]
+
     def test_meal_plan_validation_workflow(self, api_client, sample_meal_plan):
         """Test meal plan validation workflow."""
-        # Valid plan
+        # Valid plan, through the API
         response = api_client.post("/api/meal-plan/validate", json=sample_meal_plan)
 
         assert response.status_code == 200
@@ -128,18 +149,16 @@ class TestEndToEndWorkflow:
             "shopping_trips": [],
         }
 
-        response = api_client.post("/api/meal-plan/validate", json=invalid_plan)
+        # Validation checks themselves don't need the HTTP round trip
+        errors = find_meal_plan_errors(
+            MealPlanRequest(**invalid_plan), {"test_spaghetti"}, {"John", "Jane"}, Localizer(language="english")
+        )
 
-        # Should still return 200 but with errors
-        assert response.status_code == 200
-        data = response.json()
-        assert data["valid"] is False
-        assert len(data["errors"]) > 0
+        assert len(errors) > 0
+        assert "2026-01-05" in errors[0]
 
-    def test_quantity_calculation_workflow(self, sample_meals_database, sample_config):
+    def test_quantity_calculation_workflow(self, planner):
         """Test ingredient quantity calculation workflow."""
-        from recipier.meal_planner import MealPlanner
-
         # Create meal plan with specific quantities
         meal_plan = {
             "scheduled_meals": [
@@ -158,7 +177,6 @@ class TestEndToEndWorkflow:
             "shopping_trips": [],
         }
 
-        planner = MealPlanner(sample_config, sample_meals_database)
         expanded = planner.expand_meal_plan(meal_plan)
 
         # Verify calculations
@@ -176,10 +194,8 @@ class TestEndToEndWorkflow:
         # Total should be sum
         assert spaghetti["quantity"] == pytest.approx(434, abs=1)
 
-    def test_multi_cooking_date_workflow(self, sample_meals_database, sample_config):
+    def test_multi_cooking_date_workflow(self, planner):
         """Test workflow with multiple cooking dates."""
-        from recipier.meal_planner import MealPlanner
-
         meal_plan = {
             "scheduled_meals": [
                 {
@@ -194,7 +210,6 @@ class TestEndToEndWorkflow:
             "shopping_trips": [],
         }
 
-        planner = MealPlanner(sample_config, sample_meals_database)
         expanded = planner.expand_meal_plan(meal_plan)
 
         # Should create 3 cooking tasks
@@ -202,13 +217,13 @@ class TestEndToEndWorkflow:
         assert len(cooking_tasks) == 3
 
         # Each should have session information
-        for i, task in enumerate(cooking_tasks, 1):
-            assert f"session {i} of 3" in task.description.lower() or f"sesja {i} z 3" in task.description.lower()
+        expected_sessions = [(f"session {i} of 3", f"sesja {i} z 3") for i in range(1, 4)]
+        for (english, polish), task in zip(expected_sessions, cooking_tasks):
+            description = task.description.lower()
+            assert english in description or polish in description
 
-    def test_shopping_trip_with_multiple_meals(self, sample_meals_database, sample_config):
+    def test_shopping_trip_with_multiple_meals(self, planner):
         """Test shopping trip combining multiple meals."""
-        from recipier.meal_planner import MealPlanner
-
         meal_plan = {
             "scheduled_meals": [
                 {
@@ -231,7 +246,6 @@ class TestEndToEndWorkflow:
             "shopping_trips": [{"shopping_date": "2026-01-05", "scheduled_meal_ids": ["sm_1", "sm_2"]}],
         }
 
-        planner = MealPlanner(sample_config, sample_meals_database)
         expanded = planner.expand_meal_plan(meal_plan)
 
         shopping_tasks = planner.create_shopping_tasks(expanded)
@@ -13,17 +13,15 @@ from recipier.config import TaskConfig, TodoistConfig
 class TestTaskConfig:
     """Tests for TaskConfig class."""
 
-    def test_default_config(self):
+    def test_default_config(self, default_config):
         """Test default configuration values."""
-        config = TaskConfig()
-
-        assert config.use_emojis is True
-        assert config.language == "polish"
-        assert config.todoist.project_name == "Meal Planning"
-        assert config.shopping_priority == 2
-        assert config.prep_priority == 2
-        assert config.cooking_priority == 3
-        assert len(config.shopping_categories) == 9
+        assert default_config.use_emojis is True
+        assert default_config.language == "polish"
+        assert default_config.todoist.project_name == "Meal Planning"
+        assert default_config.shopping_priority == 2
+        assert default_config.prep_priority == 2
+        assert default_config.cooking_priority == 3
+        assert len(default_config.shopping_categories) == 9
 
     def test_custom_config(self):
         """Test custom configuration."""
@@ -112,10 +110,8 @@ class TestTaskConfig:
         assert data["language"] == "english"
         assert data["todoist"]["project_name"] == "Save Test"
 
-    def test_shopping_categories_order(self):
+    def test_shopping_categories_order(self, default_config):
         """Test shopping categories maintain order."""
-        config = TaskConfig()
-
         expected_order = [
             "produce",
             "meat",
@@ -127,17 +123,15 @@ class TestTaskConfig:
             "spices",
             "other",
         ]
-        assert config.shopping_categories == expected_order
+        assert default_config.shopping_categories == expected_order
 
-    def test_todoist_config_defaults(self):
+    def test_todoist_config_defaults(self, default_config):
         """Test Todoist-specific configuration defaults."""
-        config = TaskConfig()
-
         # Check todoist defaults
-        assert config.todoist.project_name == "Meal Planning"
-        assert config.todoist.use_sections is True
-        assert config.todoist.user_mapping == {}
-        assert config.todoist.shopping_labels == []
-        assert config.todoist.prep_labels == []
-        assert config.todoist.cooking_labels == []
-        assert config.todoist.serving_labels == []
+        assert default_config.todoist.project_name == "Meal Planning"
+        assert default_config.todoist.use_sections is True
+        assert default_config.todoist.user_mapping == {}
+        assert default_config.todoist.shopping_labels == []
+        assert default_config.todoist.prep_labels == []
+        assert default_config.todoist.cooking_labels == []
+        assert default_config.todoist.serving_labels == []
@@ -2,10 +2,29 @@
 Unit tests for localization module.
 """
 
+import re
+
 import pytest
 
 from recipier.localization import Localizer, Translations
 
+# Format placeholders such as {count}
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+
+# Keys every language must translate
+_REQUIRED_KEYS = frozenset(
+    {
+        "app_title",
+        "meals_loaded",
+        "shopping_task_title",
+        "cooking_task_title",
+        "serving_task_title",
+        "breakfast",
+        "dinner",
+        "supper",
+    }
+)
+
 
 @pytest.mark.unit
 class TestLocalizer:
@@ -16,29 +35,24 @@ class TestLocalizer:
         loc = Localizer(language="polish")
 
         assert loc.language == "polish"
-        assert loc.translations == Translations.POLISH
+        assert loc.translations is Translations.POLISH
 
     def test_english_localizer(self):
         """Test English localizer initialization."""
         loc = Localizer(language="english")
 
         assert loc.language == "english"
-        assert loc.translations == Translations.ENGLISH
+        assert loc.translations is Translations.ENGLISH
 
     def test_invalid_language(self):
         """Test invalid language raises error."""
         with pytest.raises(ValueError, match="Unsupported language: spanish"):
             Localizer(language="spanish")
 
-    def test_case_insensitive(self):
+    @pytest.mark.parametrize("language", ["POLISH", "Polish", "polish"])
+    def test_case_insensitive(self, language):
         """Test language parameter is case-insensitive."""
-        loc1 = Localizer(language="POLISH")
-        loc2 = Localizer(language="Polish")
-        loc3 = Localizer(language="polish")
-
-        assert loc1.language == "polish"
-        assert loc2.language == "polish"
-        assert loc3.language == "polish"
+        assert Localizer(language=language).language == "polish"
 
     def test_translate_simple_key(self):
         """Test translating simple key."""
@@ -72,42 +86,17 @@ class TestLocalizer:
         assert loc_en.get_meal_type_translation("dinner") == "Dinner"
         assert loc_pl.get_meal_type_translation("dinner") == "Obiad"
 
-    def test_polish_translations_complete(self):
-        """Test Polish translations have all required keys."""
-        required_keys = [
-            "app_title",
-            "meals_loaded",
-            "shopping_task_title",
-            "cooking_task_title",
-            "serving_task_title",
-            "breakfast",
-            "dinner",
-            "supper",
-        ]
-
-        for key in required_keys:
-            assert key in Translations.POLISH, f"Missing key: {key}"
-
-    def test_english_translations_complete(self):
-        """Test English translations have all required keys."""
-        required_keys = [
-            "app_title",
-            "meals_loaded",
-            "shopping_task_title",
-            "cooking_task_title",
-            "serving_task_title",
-            "breakfast",
-            "dinner",
-            "supper",
-        ]
-
-        for key in required_keys:
-            assert key in Translations.ENGLISH, f"Missing key: {key}"
+    @pytest.mark.parametrize("translations", [Translations.POLISH, Translations.ENGLISH], ids=["polish", "english"])
+    def test_translations_complete(self, translations):
+        """Test translations have all required keys."""
+        missing_keys = _REQUIRED_KEYS - translations.keys()
+
+        assert not missing_keys, f"Missing keys: {missing_keys}"
 
     def test_translations_parity(self):
         """Test Polish and English have same keys."""
-        polish_keys = set(Translations.POLISH.keys())
-        english_keys = set(Translations.ENGLISH.keys())
+        polish_keys = Translations.POLISH.keys()
+        english_keys = Translations.ENGLISH.keys()
 
         missing_in_english = polish_keys - english_keys
         missing_in_polish = english_keys - polish_keys
@@ -117,18 +106,12 @@ class TestLocalizer:
 
     def test_format_placeholders_match(self):
         """Test that format placeholders match between languages."""
-        import re
-
-        # Get all keys
-        keys = Translations.POLISH.keys()
-
-        for key in keys:
-            polish_text = Translations.POLISH[key]
+        for key, polish_text in Translations.POLISH.items():
             english_text = Translations.ENGLISH[key]
 
             # Extract placeholders {xxx}
-            polish_placeholders = set(re.findall(r"\{(\w+)\}", polish_text))
-            english_placeholders = set(re.findall(r"\{(\w+)\}", english_text))
+            polish_placeholders = frozenset(_PLACEHOLDER_RE.findall(polish_text))
+            english_placeholders = frozenset(_PLACEHOLDER_RE.findall(english_text))
 
             assert (
                 polish_placeholders == english_placeholders
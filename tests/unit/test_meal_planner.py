@@ -2,10 +2,28 @@
 Unit tests for meal planner module.
 """
 
+import copy
+
 import pytest
 
-from recipier.localization import Localizer
-from recipier.meal_planner import MealPlanner, Task
+from recipier.meal_planner import MealPlanner, Task, _proportional_shares
+
+
+def _build_single_meal_plan(cooking_dates, eating_dates_per_person):
+    """Meal plan with a single spaghetti dinner cooked by John and no shopping trips."""
+    return {
+        "scheduled_meals": [
+            {
+                "id": "sm_1",
+                "meal_id": "test_spaghetti",
+                "cooking_dates": cooking_dates,
+                "eating_dates_per_person": eating_dates_per_person,
+                "meal_type": "dinner",
+                "assigned_cook": "John",
+            }
+        ],
+        "shopping_trips": [],
+    }
 
 
 @pytest.mark.unit
@@ -30,16 +48,12 @@ class TestMealPlanner:
         assert "shopping_trips" in expanded
         assert len(expanded["meals"]) == 2
 
-    def test_expand_meal_plan_quantity_calculation(self, sample_meals_database, sample_meal_plan, sample_config):
+    def test_expand_meal_plan_quantity_calculation(self, expanded_ingredients_by_name):
         """Test ingredient quantity calculations."""
-        planner = MealPlanner(sample_config, sample_meals_database)
-        expanded = planner.expand_meal_plan(sample_meal_plan)
-
         # First meal: Spaghetti
         # John: 2 eating dates, high_calorie (1.67x)
         # Jane: 1 eating date, low_calorie (1.0x)
-        meal = expanded["meals"][0]
-        spaghetti_ingredient = next(i for i in meal["ingredients"] if i["name"] == "spaghetti")
+        spaghetti_ingredient = expanded_ingredients_by_name["spaghetti"]
 
         # Total quantity should be:
         # John: 100g × 1.67 × 2 = 334g
@@ -47,12 +61,9 @@ class TestMealPlanner:
         # Total: 434g
         assert spaghetti_ingredient["quantity"] == pytest.approx(434, abs=1)
 
-    def test_calculate_meal_calories(self, sample_meals_database, sample_meal_plan, sample_config):
+    def test_calculate_meal_calories(self, planner, expanded_sample_plan):
         """Test calorie calculation for meals."""
-        planner = MealPlanner(sample_config, sample_meals_database)
-
-        # Expand meal plan to get per_person data
-        expanded = planner.expand_meal_plan(sample_meal_plan)
+        expanded = expanded_sample_plan
         expanded_meal = expanded["meals"][0]  # Spaghetti with per_person breakdown
 
         # Calculate calories (uses self.ingredient_calories)
@@ -62,10 +73,48 @@ class TestMealPlanner:
         assert "low_calorie" in calories
         assert calories["high_calorie"] > calories["low_calorie"]
 
-    def test_create_shopping_tasks(self, sample_meals_database, sample_meal_plan, sample_config):
+    def test_calculate_meal_plan_nutrition(self, planner, sample_meal_plan, expanded_sample_plan):
+        """Test plan nutrition is keyed by scheduled meal id and matches per-meal results."""
+        nutrition = planner.calculate_meal_plan_nutrition(sample_meal_plan, apply_rounding=False)
+
+        assert list(nutrition) == [scheduled["id"] for scheduled in sample_meal_plan["scheduled_meals"]]
+        for meal in expanded_sample_plan["meals"]:
+            assert nutrition[meal["id"]] == planner.calculate_meal_nutrition(meal)
+
+    def test_calculate_meal_plan_nutrition_without_ingredient_details(
+        self, sample_meals_database, sample_meal_plan, sample_config
+    ):
+        """Test that meals get empty nutrition, but are still validated, without ingredient details."""
+        meals_db = {"meals": sample_meals_database["meals"]}
+        planner = MealPlanner(sample_config, meals_db)
+
+        nutrition = planner.calculate_meal_plan_nutrition(sample_meal_plan)
+
+        assert nutrition == {scheduled["id"]: {} for scheduled in sample_meal_plan["scheduled_meals"]}
+
+        unknown_meal_plan = {
+            "scheduled_meals": [{**sample_meal_plan["scheduled_meals"][0], "meal_id": "unknown_meal"}],
+            "shopping_trips": [],
+        }
+        with pytest.raises(ValueError):
+            planner.calculate_meal_plan_nutrition(unknown_meal_plan)
+
+    def test_convert_ingredient_for_display(self, sample_config):
+        """Test grams are converted to display units for ingredients that define them."""
+        meals_db = {"meals": [], "ingredient_details": {"eggs": {"grams_per_unit": 50, "display_unit": "pcs"}}}
+        planner = MealPlanner(sample_config, meals_db)
+
+        assert planner.convert_ingredient_for_display("eggs", 240, "g") == (5, "pcs")
+        assert planner.convert_ingredient_for_display("eggs", 2, "pcs") == (2, "pcs")
+        assert planner.convert_ingredient_for_display("rice", 240, "g") == (240, "g")
+
+        # Replacing the details refreshes the conversions
+        planner.ingredient_details = {}
+        assert planner.convert_ingredient_for_display("eggs", 240, "g") == (240, "g")
+
+    def test_create_shopping_tasks(self, planner, expanded_sample_plan):
         """Test shopping task generation."""
-        planner = MealPlanner(sample_config, sample_meals_database)
-        expanded = planner.expand_meal_plan(sample_meal_plan)
+        expanded = copy.deepcopy(expanded_sample_plan)  # Rounding rewrites quantities in place
 
         tasks = planner.create_shopping_tasks(expanded)
 
@@ -76,10 +125,9 @@ class TestMealPlanner:
         assert task.due_date == "2026-01-05"
         assert len(task.subtasks) > 0  # Should have ingredient subtasks
 
-    def test_create_cooking_tasks(self, sample_meals_database, sample_meal_plan, sample_config):
+    def test_create_cooking_tasks(self, planner, expanded_sample_plan):
         """Test cooking task generation."""
-        planner = MealPlanner(sample_config, sample_meals_database)
-        expanded = planner.expand_meal_plan(sample_meal_plan)
+        expanded = expanded_sample_plan
 
         tasks = planner.create_cooking_tasks(expanded)
 
@@ -92,10 +140,9 @@ class TestMealPlanner:
         assert task.assigned_to == "John"
         assert "dinner" in task.description.lower()
 
-    def test_create_serving_tasks(self, sample_meals_database, sample_meal_plan, sample_config):
+    def test_create_serving_tasks(self, planner, expanded_sample_plan, localizer):
         """Test serving task generation."""
-        planner = MealPlanner(sample_config, sample_meals_database)
-        expanded = planner.expand_meal_plan(sample_meal_plan)
+        expanded = expanded_sample_plan
 
         tasks = planner.create_serving_tasks(expanded)
 
@@ -110,14 +157,12 @@ class TestMealPlanner:
             # As per new requirement, serving tasks should NOT have subtasks
             assert len(task.subtasks) == 0
             # But the description should contain ingredient info
-            loc = Localizer(sample_config.language)
-            expected_header = loc.t("ingredients_header")
+            expected_header = localizer.t("ingredients_header")
             assert expected_header in task.description
 
-    def test_create_prep_tasks(self, sample_meals_database, sample_meal_plan, sample_config):
+    def test_create_prep_tasks(self, planner, expanded_sample_plan):
         """Test prep task generation."""
-        planner = MealPlanner(sample_config, sample_meals_database)
-        expanded = planner.expand_meal_plan(sample_meal_plan)
+        expanded = expanded_sample_plan
 
         tasks = planner.create_prep_tasks(expanded)
 
@@ -128,10 +173,9 @@ class TestMealPlanner:
         assert task.task_type == "prep"
         assert "lettuce" in task.description.lower() or "chop" in task.description.lower()
 
-    def test_prep_tasks_have_ingredient_subtasks(self, sample_meals_database, sample_meal_plan, sample_config):
+    def test_prep_tasks_have_ingredient_subtasks(self, planner, expanded_sample_plan):
         """Test that prep tasks include per-person ingredient subtasks."""
-        planner = MealPlanner(sample_config, sample_meals_database)
-        expanded = planner.expand_meal_plan(sample_meal_plan)
+        expanded = expanded_sample_plan
 
         tasks = planner.create_prep_tasks(expanded)
 
@@ -148,28 +192,18 @@ class TestMealPlanner:
         # Subtasks should have ingredient name and quantity in title
         assert any("g" in subtask.title or "ml" in subtask.title for subtask in task.subtasks)
 
-    def test_generate_all_tasks(self, sample_meals_database, sample_meal_plan, sample_config):
+    def test_generate_all_tasks(self, planner, sample_meal_plan):
         """Test generating all task types."""
-        planner = MealPlanner(sample_config, sample_meals_database)
-
         # generate_all_tasks now handles expansion internally
         all_tasks = planner.generate_all_tasks(sample_meal_plan)
 
         # Should have shopping, prep, cooking, and eating tasks
         task_types = {task.task_type for task in all_tasks}
-        assert "shopping" in task_types
-        assert "cooking" in task_types
-
-        # Verify total count
-        assert len(all_tasks) > 0
+        assert {"shopping", "cooking"} <= task_types  # Implies at least one task was generated
 
-    def test_per_person_ingredient_breakdown(self, sample_meals_database, sample_meal_plan, sample_config):
+    def test_per_person_ingredient_breakdown(self, expanded_ingredients_by_name):
         """Test per-person ingredient breakdown."""
-        planner = MealPlanner(sample_config, sample_meals_database)
-        expanded = planner.expand_meal_plan(sample_meal_plan)
-
-        meal = expanded["meals"][0]
-        spaghetti = next(i for i in meal["ingredients"] if i["name"] == "spaghetti")
+        spaghetti = expanded_ingredients_by_name["spaghetti"]
 
         assert "per_person" in spaghetti
         assert "John" in spaghetti["per_person"]
@@ -180,10 +214,9 @@ class TestMealPlanner:
         jane_qty = spaghetti["per_person"]["Jane"]["quantity"]
         assert john_qty > jane_qty
 
-    def test_ingredient_category_grouping(self, sample_meals_database, sample_meal_plan, sample_config):
+    def test_ingredient_category_grouping(self, planner, expanded_sample_plan, sample_config):
         """Test ingredients are grouped by category."""
-        planner = MealPlanner(sample_config, sample_meals_database)
-        expanded = planner.expand_meal_plan(sample_meal_plan)
+        expanded = copy.deepcopy(expanded_sample_plan)  # Rounding rewrites quantities in place
 
         tasks = planner.create_shopping_tasks(expanded)
         task = tasks[0]
@@ -195,77 +228,80 @@ class TestMealPlanner:
                 categories_in_order.append(subtask.labels[0])
 
         # Check that categories follow config order
-        config_categories = sample_config.shopping_categories
-        for i in range(len(categories_in_order) - 1):
-            cat1_idx = config_categories.index(categories_in_order[i])
-            cat2_idx = config_categories.index(categories_in_order[i + 1])
-            assert cat1_idx <= cat2_idx
-
-    def test_meal_prep_vs_separate_cooking(self, sample_meals_database, sample_config):
-        """Test meal prep (1 cooking date) vs separate cooking (multiple dates)."""
-        planner = MealPlanner(sample_config, sample_meals_database)
-
-        # Meal prep: 1 cooking date, multiple eating dates
-        meal_prep_plan = {
-            "scheduled_meals": [
-                {
-                    "id": "sm_1",
-                    "meal_id": "test_spaghetti",
-                    "cooking_dates": ["2026-01-06"],
-                    "eating_dates_per_person": {"John": ["2026-01-06", "2026-01-07", "2026-01-08"]},
-                    "meal_type": "dinner",
-                    "assigned_cook": "John",
-                }
-            ],
-            "shopping_trips": [],
-        }
+        category_index = {category: i for i, category in enumerate(sample_config.shopping_categories)}
+        positions = [category_index[category] for category in categories_in_order]
+        assert positions == sorted(positions)
+
+    def test_sort_ingredients_by_category(self, sample_config):
+        """Test ingredients are ordered by configured category, then name, dropping unknown categories."""
+        planner = MealPlanner(sample_config, {"meals": []})
+        ingredients = [
+            {"name": "spaghetti", "category": "pantry"},
+            {"name": "lettuce", "category": "produce"},
+            {"name": "bacon", "category": "meat"},
+            {"name": "apple", "category": "produce"},
+            {"name": "mystery", "category": "not_configured"},
+        ]
 
-        expanded = planner.expand_meal_plan(meal_prep_plan)
-        cooking_tasks = planner.create_cooking_tasks(expanded)
+        ordered = planner.sort_ingredients_by_category(ingredients)
 
-        assert len(cooking_tasks) == 1  # Only 1 cooking task
+        assert [ing["name"] for ing in ordered] == ["apple", "lettuce", "bacon", "spaghetti"]
 
-        # Separate cooking: multiple cooking dates
-        separate_plan = {
-            "scheduled_meals": [
-                {
-                    "id": "sm_2",
-                    "meal_id": "test_spaghetti",
-                    "cooking_dates": ["2026-01-06", "2026-01-07", "2026-01-08"],
-                    "eating_dates_per_person": {"John": ["2026-01-06", "2026-01-07", "2026-01-08"]},
-                    "meal_type": "dinner",
-                    "assigned_cook": "John",
-                }
-            ],
-            "shopping_trips": [],
-        }
+    def test_filter_ingredients_for_people(self, sample_config):
+        """Test ingredients are narrowed to the people eating, with totals recomputed."""
+        planner = MealPlanner(sample_config, {"meals": []})
+        ingredients = [
+            {
+                "name": "spaghetti",
+                "quantity": 300,
+                "per_person": {"John": {"quantity": 200}, "Jane": {"quantity": 100}},
+            },
+            {"name": "bacon", "quantity": 100, "per_person": {"Jane": {"quantity": 100}}},
+            {"name": "salt", "quantity": 5},
+        ]
+        filtered = planner.filter_ingredients_for_people(ingredients, ["John"])
+
+        assert [ing["name"] for ing in filtered] == ["spaghetti", "salt"]
+        assert filtered[0]["quantity"] == 200
+        assert filtered[0]["per_person"] == {"John": {"quantity": 200}}
+        assert ingredients[0]["quantity"] == 300  # Input is not mutated
+        assert planner.filter_ingredients_for_people(ingredients, []) == []
+
+    @pytest.mark.parametrize(
+        "cooking_dates,expected_tasks",
+        [
+            (["2026-01-06"], 1),
+            (["2026-01-06", "2026-01-07", "2026-01-08"], 3),
+        ],
+        ids=["meal-prep", "separate-cooking"],
+    )
+    def test_meal_prep_vs_separate_cooking(self, planner, cooking_dates, expected_tasks):
+        """Test meal prep (1 cooking date) vs separate cooking (multiple dates)."""
+        plan = _build_single_meal_plan(cooking_dates, {"John": ["2026-01-06", "2026-01-07", "2026-01-08"]})
 
-        expanded2 = planner.expand_meal_plan(separate_plan)
-        cooking_tasks2 = planner.create_cooking_tasks(expanded2)
+        expanded = planner.expand_meal_plan(plan)
+        cooking_tasks = planner.create_cooking_tasks(expanded)
 
-        assert len(cooking_tasks2) == 3  # 3 cooking tasks
+        assert len(cooking_tasks) == expected_tasks  # One cooking task per cooking date
 
-    def test_shopping_task_title_localized(self, sample_meals_database, sample_meal_plan, sample_config):
+    def test_shopping_task_title_localized(self, planner, expanded_sample_plan, localizer):
         """Test shopping task title uses localization."""
-        planner = MealPlanner(sample_config, sample_meals_database)
-        expanded = planner.expand_meal_plan(sample_meal_plan)
+        expanded = copy.deepcopy(expanded_sample_plan)  # Rounding rewrites quantities in place
 
         tasks = planner.create_shopping_tasks(expanded)
         task = tasks[0]
 
         # Should use localized title format
-        loc = Localizer(sample_config.language)
         # Extract the prefix from the template (remove placeholders)
-        template = loc.t("shopping_task_title", emoji="", meals="").strip()
+        template = localizer.t("shopping_task_title", emoji="", meals="").strip()
         expected_prefix = template.rstrip(":")  # Remove trailing colon to check prefix only
         assert expected_prefix in task.title or template.split("{")[0] in task.title
         # Should include meal names
         assert any(meal_name in task.title for meal_name in ["Spaghetti", "Salad", "Caesar"])
 
-    def test_shopping_task_diet_breakdown(self, sample_meals_database, sample_meal_plan, sample_config):
+    def test_shopping_task_diet_breakdown(self, planner, expanded_sample_plan):
         """Test shopping task shows diet breakdown instead of total portions."""
-        planner = MealPlanner(sample_config, sample_meals_database)
-        expanded = planner.expand_meal_plan(sample_meal_plan)
+        expanded = copy.deepcopy(expanded_sample_plan)  # Rounding rewrites quantities in place
 
         tasks = planner.create_shopping_tasks(expanded)
         task = tasks[0]
@@ -276,112 +312,35 @@ class TestMealPlanner:
         # Should not have the old "x2" or "x3" format
         assert " x2" not in task.description and " x3" not in task.description
 
-    def test_cooking_task_eating_today_note(self, sample_meals_database, sample_config):
-        """Test cooking task shows 'eating today' note when someone eats on cooking day."""
-        planner = MealPlanner(sample_config, sample_meals_database)
-
-        # Person eats on cooking day
-        plan = {
-            "scheduled_meals": [
-                {
-                    "id": "sm_1",
-                    "meal_id": "test_spaghetti",
-                    "cooking_dates": ["2026-01-06"],
-                    "eating_dates_per_person": {"John": ["2026-01-06", "2026-01-07"]},  # Eats on cooking day
-                    "meal_type": "dinner",
-                    "assigned_cook": "John",
-                }
-            ],
-            "shopping_trips": [],
-        }
-
-        expanded = planner.expand_meal_plan(plan)
-        tasks = planner.create_cooking_tasks(expanded)
-        task = tasks[0]
-
-        # Should have "eating today" note
-        loc = Localizer(sample_config.language)
-        # Extract the label part from the template (before the people placeholder)
-        template = loc.t("cooking_task_eating_today", people="")
-        expected_label = template.split(":")[0]  # Get "🍽️ Eating today" or "🍽️ Jedzenie dzisiaj"
-        assert expected_label in task.description
-        assert "John" in task.description
-
-    def test_cooking_task_meal_prep_note(self, sample_meals_database, sample_config):
-        """Test cooking task shows meal prep note when nobody eats on cooking day."""
-        planner = MealPlanner(sample_config, sample_meals_database)
-
-        # Nobody eats on cooking day (meal prep scenario)
-        plan = {
-            "scheduled_meals": [
-                {
-                    "id": "sm_1",
-                    "meal_id": "test_spaghetti",
-                    "cooking_dates": ["2026-01-06"],
-                    "eating_dates_per_person": {"John": ["2026-01-07", "2026-01-08"]},  # Eats AFTER cooking day
-                    "meal_type": "dinner",
-                    "assigned_cook": "John",
-                }
-            ],
-            "shopping_trips": [],
-        }
+    @pytest.mark.parametrize(
+        "eating_dates,expected_note_key",
+        [
+            (["2026-01-06", "2026-01-07"], "cooking_task_eating_today"),  # Eats on cooking day
+            (["2026-01-07", "2026-01-08"], "cooking_task_meal_prep_note"),  # Eats AFTER cooking day
+        ],
+        ids=["eating-today", "meal-prep"],
+    )
+    def test_cooking_task_notes(self, planner, eating_dates, expected_note_key, localizer):
+        """Test cooking task notes who eats on the cooking day, or that it is meal prep when nobody does."""
+        plan = _build_single_meal_plan(["2026-01-06"], {"John": eating_dates})
 
         expanded = planner.expand_meal_plan(plan)
         tasks = planner.create_cooking_tasks(expanded)
         task = tasks[0]
 
-        # Should have meal prep note
-        loc = Localizer(sample_config.language)
-        expected_note = loc.t("cooking_task_meal_prep_note")
-        assert expected_note in task.description
+        assert localizer.t(expected_note_key, people="John") in task.description
 
-    def test_cooking_task_includes_steps(self, sample_config):
+    def test_cooking_task_includes_steps(self, recipe_planner, localizer):
         """Test that cooking tasks include step-by-step cooking instructions."""
-        # Create a meals database with steps
-        meals_db_with_steps = {
-            "meals": [
-                {
-                    "meal_id": "test_spaghetti",
-                    "name": "Test Spaghetti Carbonara",
-                    "base_servings": {"high_calorie": 1.67, "low_calorie": 1.0},
-                    "ingredients": [
-                        {"name": "spaghetti", "quantity": 100, "unit": "g", "category": "pantry"},
-                    ],
-                    "steps": [
-                        "Boil water in a large pot",
-                        "Cook pasta according to package instructions",
-                        "Mix eggs and cheese in a bowl",
-                        "Combine pasta with egg mixture",
-                    ],
-                    "suggested_seasonings": "salt, pepper, parmesan",
-                }
-            ],
-            "ingredient_calories": {"spaghetti": 371},
-        }
-
-        planner = MealPlanner(sample_config, meals_db_with_steps)
-
-        plan = {
-            "scheduled_meals": [
-                {
-                    "id": "sm_1",
-                    "meal_id": "test_spaghetti",
-                    "cooking_dates": ["2026-01-06"],
-                    "eating_dates_per_person": {"John": ["2026-01-06"]},
-                    "meal_type": "dinner",
-                    "assigned_cook": "John",
-                }
-            ],
-            "shopping_trips": [],
-        }
+        planner = recipe_planner
+        plan = _build_single_meal_plan(["2026-01-06"], {"John": ["2026-01-06"]})
 
         expanded = planner.expand_meal_plan(plan)
         tasks = planner.create_cooking_tasks(expanded)
         task = tasks[0]
 
         # Should include cooking steps header
-        loc = Localizer(sample_config.language)
-        expected_steps_header = loc.t("cooking_steps_header")
+        expected_steps_header = localizer.t("cooking_steps_header")
         assert expected_steps_header in task.description
 
         # Should include numbered steps
@@ -391,153 +350,30 @@ class TestMealPlanner:
         assert "4. Combine pasta with egg mixture" in task.description
 
         # Should include suggested seasonings
-        expected_seasonings_label = loc.t("suggested_seasonings_label")
+        expected_seasonings_label = localizer.t("suggested_seasonings_label")
         assert expected_seasonings_label in task.description
-        assert "salt, pepper, parmesan" in task.description
+        assert "salt, pepper, basil" in task.description
 
-    def test_shopping_task_includes_seasonings(self, sample_config):
+    def test_shopping_task_includes_seasonings(self, seasoning_shopping_task, seasoning_subtasks):
         """Test that shopping tasks include unique seasonings from all meals."""
-        # Create meals with different seasonings
-        meals_db_with_seasonings = {
-            "meals": [
-                {
-                    "meal_id": "test_spaghetti",
-                    "name": "Test Spaghetti",
-                    "base_servings": {"high_calorie": 1.67, "low_calorie": 1.0},
-                    "ingredients": [
-                        {"name": "spaghetti", "quantity": 100, "unit": "g", "category": "pantry"},
-                    ],
-                    "suggested_seasonings": "salt, pepper, basil",
-                },
-                {
-                    "meal_id": "test_salad",
-                    "name": "Test Salad",
-                    "base_servings": {"high_calorie": 1.5, "low_calorie": 1.0},
-                    "ingredients": [
-                        {"name": "lettuce", "quantity": 100, "unit": "g", "category": "produce"},
-                    ],
-                    "suggested_seasonings": "salt, olive oil, lemon juice",
-                },
-            ],
-            "ingredient_calories": {"spaghetti": 371, "lettuce": 15},
-        }
-
-        planner = MealPlanner(sample_config, meals_db_with_seasonings)
-
-        plan = {
-            "scheduled_meals": [
-                {
-                    "id": "sm_1",
-                    "meal_id": "test_spaghetti",
-                    "cooking_dates": ["2026-01-06"],
-                    "eating_dates_per_person": {"John": ["2026-01-06"]},
-                    "meal_type": "dinner",
-                    "assigned_cook": "John",
-                },
-                {
-                    "id": "sm_2",
-                    "meal_id": "test_salad",
-                    "cooking_dates": ["2026-01-07"],
-                    "eating_dates_per_person": {"Jane": ["2026-01-07"]},
-                    "meal_type": "dinner",
-                    "assigned_cook": "Jane",
-                },
-            ],
-            "shopping_trips": [
-                {
-                    "shopping_date": "2026-01-05",
-                    "scheduled_meal_ids": ["sm_1", "sm_2"],
-                }
-            ],
-        }
-
-        expanded = planner.expand_meal_plan(plan)
-        tasks = planner.create_shopping_tasks(expanded)
-        task = tasks[0]
+        task = seasoning_shopping_task
 
         # Should have subtasks
         assert len(task.subtasks) > 0
 
-        # Find seasoning subtasks (they have the seasoning_note in them)
-        loc = Localizer(sample_config.language)
-        seasoning_note = loc.t("seasoning_note")
-        seasoning_subtasks = [st for st in task.subtasks if seasoning_note in st.title]
-
-        # Should have unique seasonings from both meals
+        # Should have unique seasonings from all meals
         assert len(seasoning_subtasks) > 0
 
-        # Should include seasonings from both meals
+        # Should include seasonings from all meals
         all_seasoning_titles = " ".join([st.title for st in seasoning_subtasks])
         assert "salt" in all_seasoning_titles.lower() or "sól" in all_seasoning_titles.lower()
         assert "pepper" in all_seasoning_titles.lower() or "pieprz" in all_seasoning_titles.lower()
         assert "basil" in all_seasoning_titles.lower() or "bazylia" in all_seasoning_titles.lower()
         assert "olive oil" in all_seasoning_titles.lower() or "oliwa" in all_seasoning_titles.lower()
+        assert "oregano" in all_seasoning_titles.lower()
 
-    def test_seasonings_deduplicated_in_shopping_list(self, sample_config):
+    def test_seasonings_deduplicated_in_shopping_list(self, seasoning_subtasks):
         """Test that duplicate seasonings across meals are deduplicated in shopping list."""
-        # Create meals with overlapping seasonings
-        meals_db = {
-            "meals": [
-                {
-                    "meal_id": "test_spaghetti",
-                    "name": "Test Spaghetti",
-                    "base_servings": {"high_calorie": 1.67, "low_calorie": 1.0},
-                    "ingredients": [
-                        {"name": "spaghetti", "quantity": 100, "unit": "g", "category": "pantry"},
-                    ],
-                    "suggested_seasonings": "salt, pepper, basil",
-                },
-                {
-                    "meal_id": "test_pasta",
-                    "name": "Test Pasta",
-                    "base_servings": {"high_calorie": 1.5, "low_calorie": 1.0},
-                    "ingredients": [
-                        {"name": "pasta", "quantity": 100, "unit": "g", "category": "pantry"},
-                    ],
-                    "suggested_seasonings": "salt, pepper, oregano",  # salt and pepper overlap
-                },
-            ],
-            "ingredient_calories": {"spaghetti": 371, "pasta": 371},
-        }
-
-        planner = MealPlanner(sample_config, meals_db)
-
-        plan = {
-            "scheduled_meals": [
-                {
-                    "id": "sm_1",
-                    "meal_id": "test_spaghetti",
-                    "cooking_dates": ["2026-01-06"],
-                    "eating_dates_per_person": {"John": ["2026-01-06"]},
-                    "meal_type": "dinner",
-                    "assigned_cook": "John",
-                },
-                {
-                    "id": "sm_2",
-                    "meal_id": "test_pasta",
-                    "cooking_dates": ["2026-01-07"],
-                    "eating_dates_per_person": {"Jane": ["2026-01-07"]},
-                    "meal_type": "dinner",
-                    "assigned_cook": "Jane",
-                },
-            ],
-            "shopping_trips": [
-                {
-                    "shopping_date": "2026-01-05",
-                    "scheduled_meal_ids": ["sm_1", "sm_2"],
-                }
-            ],
-        }
-
-        expanded = planner.expand_meal_plan(plan)
-        tasks = planner.create_shopping_tasks(expanded)
-        task = tasks[0]
-
-        # Find seasoning subtasks
-        loc = Localizer(sample_config.language)
-        seasoning_note = loc.t("seasoning_note")
-        seasoning_subtasks = [st for st in task.subtasks if seasoning_note in st.title]
-
         # Count occurrences of "salt" and "pepper" - should appear only once each
         salt_count = sum(1 for st in seasoning_subtasks if "salt" in st.title.lower() or "sól" in st.title.lower())
         pepper_count = sum(
@@ -548,54 +384,9 @@ class TestMealPlanner:
         assert salt_count == 1, f"Expected 1 salt entry, found {salt_count}"
         assert pepper_count == 1, f"Expected 1 pepper entry, found {pepper_count}"
 
-    def test_seasonings_in_spices_category(self, sample_config):
+    def test_seasonings_in_spices_category(self, seasoning_shopping_task, seasoning_subtasks, sample_config):
         """Test that seasonings are categorized as 'spices' and appear at the end of shopping list."""
-        # Create meals with seasonings
-        meals_db = {
-            "meals": [
-                {
-                    "meal_id": "test_spaghetti",
-                    "name": "Test Spaghetti",
-                    "base_servings": {"high_calorie": 1.67, "low_calorie": 1.0},
-                    "ingredients": [
-                        {"name": "spaghetti", "quantity": 100, "unit": "g", "category": "pantry"},
-                        {"name": "tomato", "quantity": 50, "unit": "g", "category": "produce"},
-                    ],
-                    "suggested_seasonings": "salt, basil",
-                },
-            ],
-            "ingredient_calories": {"spaghetti": 371, "tomato": 18},
-        }
-
-        planner = MealPlanner(sample_config, meals_db)
-
-        plan = {
-            "scheduled_meals": [
-                {
-                    "id": "sm_1",
-                    "meal_id": "test_spaghetti",
-                    "cooking_dates": ["2026-01-06"],
-                    "eating_dates_per_person": {"John": ["2026-01-06"]},
-                    "meal_type": "dinner",
-                    "assigned_cook": "John",
-                },
-            ],
-            "shopping_trips": [
-                {
-                    "shopping_date": "2026-01-05",
-                    "scheduled_meal_ids": ["sm_1"],
-                }
-            ],
-        }
-
-        expanded = planner.expand_meal_plan(plan)
-        tasks = planner.create_shopping_tasks(expanded)
-        task = tasks[0]
-
-        # Find seasoning subtasks and check their labels
-        loc = Localizer(sample_config.language)
-        seasoning_note = loc.t("seasoning_note")
-        seasoning_subtasks = [st for st in task.subtasks if seasoning_note in st.title]
+        task = seasoning_shopping_task
 
         # Verify that seasonings have "spices" label (if labels are used)
         if sample_config.use_ingredient_category_labels:
@@ -675,13 +466,14 @@ class TestMealPlanner:
         expanded = planner.expand_meal_plan(plan)
         result = planner.round_and_distribute_ingredients(expanded)
 
+        # Total each ingredient across trips in one pass
+        totals = {}
+        for trip in result["ingredients_per_trip"]:
+            for ing in trip:
+                totals[ing["name"]] = totals.get(ing["name"], 0) + ing["quantity"]
+        total_budyn = totals["Budyń waniliowy bez cukru"]
+
         # Check that total across trips is a multiple of 40g (rounded at meal plan level)
-        total_budyn = sum(
-            ing["quantity"]
-            for trip in result["ingredients_per_trip"]
-            for ing in trip
-            if ing["name"] == "Budyń waniliowy bez cukru"
-        )
 
         # Total should be multiple of 40
         assert total_budyn % 40 == 0, f"Expected multiple of 40, got {total_budyn}"
@@ -877,6 +669,50 @@ class TestMealPlanner:
         # Should enforce minimum 1 unit (40g), not round to 0
         assert total_budyn == 40
 
+    def test_round_duplicate_ingredient_entries(self, sample_config):
+        """Test every entry of an ingredient a meal lists twice is rescaled to the rounded total."""
+        meals_db = {
+            "meals": [
+                {
+                    "meal_id": "budyn_double",
+                    "name": "Budyń Double",
+                    "base_servings": {"high_calorie": 1.0},
+                    "ingredients": [
+                        {"name": "Budyń waniliowy bez cukru", "quantity": 25, "unit": "g", "category": "pantry"},
+                        {"name": "Budyń waniliowy bez cukru", "quantity": 25, "unit": "g", "category": "pantry"},
+                    ],
+                }
+            ],
+            "ingredient_details": {
+                "Budyń waniliowy bez cukru": {"calories_per_100g": 90, "unit_size": 40, "adjustable": False}
+            },
+        }
+
+        planner = MealPlanner(sample_config, meals_db)
+
+        plan = {
+            "scheduled_meals": [
+                {
+                    "id": "sm_1",
+                    "meal_id": "budyn_double",
+                    "cooking_dates": ["2026-01-06"],
+                    "eating_dates_per_person": {"John": ["2026-01-06"]},
+                    "meal_type": "breakfast",
+                    "assigned_cook": "John",
+                },
+            ],
+            "shopping_trips": [
+                {"shopping_date": "2026-01-05", "scheduled_meal_ids": ["sm_1"]},
+            ],
+        }
+
+        expanded = planner.expand_meal_plan(plan)
+        result = planner.round_and_distribute_ingredients(expanded)
+
+        # 50g rounds up to 80g (2 units), split across both entries instead of landing on one of them
+        assert [ing["quantity"] for ing in expanded["meals"][0]["ingredients"]] == [40, 40]
+        assert [ing["quantity"] for ing in result["ingredients_per_trip"][0]] == [80]
+
     def test_calorie_preservation_meal_plan_level(self, sample_config):
         """Test calories maintained per profile across entire meal plan."""
         # Use adjustable ingredient to compensate for rounding changes
@@ -1130,80 +966,116 @@ class TestMealPlanner:
         total_units = sum(qty / 40 for qty in budyn_per_trip)
         assert total_units == 6
 
+    def test_proportional_shares_rounding(self):
+        """Test proportional shares round exact halves to even, like round() on the true quotient."""
+        # 91 * 9 / 14 == 58.5 exactly; float division would round it up to 59
+        assert _proportional_shares(91, [2, 9, 6], 14) == [13, 58, 39]
+        assert _proportional_shares(5, [1, 1], 2) == [2, 2]
+        assert _proportional_shares(7, [1, 1], 2) == [4, 4]
+        assert _proportional_shares(10, [2.5, 2.5], 5) == [5, 5]
+        assert _proportional_shares(10, [1, 2], 0) == [0, 0]
+
+    def test_trip_share_split_between_meals(self, sample_config):
+        """Test a trip's rounded quantity is split between its meals by their original needs."""
+        meals_db = {
+            "meals": [
+                {
+                    "meal_id": "chili",
+                    "name": "Chili",
+                    "base_servings": {"high_calorie": 1.0},
+                    "ingredients": [
+                        {"name": "Mięso mielone", "quantity": 300, "unit": "g", "category": "meat"},
+                    ],
+                }
+            ],
+            "ingredient_details": {"Mięso mielone": {"calories_per_100g": 130, "unit_size": 500, "adjustable": False}},
+        }
+
+        planner = MealPlanner(sample_config, meals_db)
+
+        # Two meals in one trip needing 300g each -> 600g rounds up to 1000g for the trip
+        plan = {
+            "scheduled_meals": [
+                {
+                    "id": f"sm_{i}",
+                    "meal_id": "chili",
+                    "cooking_dates": [date],
+                    "eating_dates_per_person": {"John": [date]},
+                    "meal_type": "dinner",
+                    "assigned_cook": "John",
+                }
+                for i, date in enumerate(["2026-01-06", "2026-01-07"], 1)
+            ],
+            "shopping_trips": [{"shopping_date": "2026-01-05", "scheduled_meal_ids": ["sm_1", "sm_2"]}],
+        }
+
+        expanded = planner.expand_meal_plan(plan)
+        result = planner.round_and_distribute_ingredients(expanded)
+
+        # Both meals had equal needs, so each gets half of the rounded trip quantity
+        assert [meal["ingredients"][0]["quantity"] for meal in expanded["meals"]] == [500, 500]
+        assert result["ingredients_per_trip"][0][0]["quantity"] == 1000
+
+
+_SUBTASK_1 = Task(title="Subtask 1", description="", due_date="", priority=3, assigned_to="", task_type="shopping")
+_SUBTASK_2 = Task(title="Subtask 2", description="", due_date="", priority=3, assigned_to="", task_type="shopping")
+
 
 @pytest.mark.unit
 class TestTaskDataclass:
     """Tests for Task dataclass."""
 
-    def test_task_creation(self):
-        """Test creating a Task instance."""
-        task = Task(
-            title="Test Task",
-            description="Test Description",
-            due_date="2026-01-06",
-            priority=2,
-            assigned_to="John",
-            meal_id="test_meal",
-            task_type="shopping",
-        )
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            (
+                {"description": "Test Description", "meal_id": "test_meal", "task_type": "shopping"},
+                {
+                    "title": "Test Task",
+                    "description": "Test Description",
+                    "due_date": "2026-01-06",
+                    "priority": 2,
+                    "task_type": "shopping",
+                },
+            ),
+            (
+                {"subtasks": [_SUBTASK_1, _SUBTASK_2]},
+                {"subtasks": [_SUBTASK_1, _SUBTASK_2]},
+            ),
+            (
+                {"labels": ["produce", "urgent"]},
+                {"labels": ["produce", "urgent"]},
+            ),
+        ],
+        ids=["basic", "subtasks", "labels"],
+    )
+    def test_task_fields(self, kwargs, expected):
+        """Test creating a Task instance, optionally with subtasks or labels."""
+        defaults = {
+            "title": "Test Task",
+            "description": "",
+            "due_date": "2026-01-06",
+            "priority": 2,
+            "assigned_to": "John",
+        }
+        task = Task(**{**defaults, **kwargs})
 
-        assert task.title == "Test Task"
-        assert task.description == "Test Description"
-        assert task.due_date == "2026-01-06"
-        assert task.priority == 2
         assert task.assigned_to == "John"
-        assert task.task_type == "shopping"
+        for field, value in expected.items():
+            assert getattr(task, field) == value
 
-    def test_task_with_subtasks(self):
-        """Test Task with subtasks."""
-        subtask1 = Task(
-            title="Subtask 1",
-            description="",
-            due_date="",
-            priority=3,
-            assigned_to="",
-            meal_id="",
-            task_type="shopping",
-        )
+    def test_task_uses_slots(self):
+        """Test Task instances use slots instead of a per-instance __dict__."""
+        task = Task(title="Test Task", description="", priority=4, assigned_to="")
 
-        subtask2 = Task(
-            title="Subtask 2",
-            description="",
-            due_date="",
-            priority=3,
-            assigned_to="",
-            meal_id="",
-            task_type="shopping",
-        )
-
-        parent_task = Task(
-            title="Parent Task",
-            description="Parent Description",
-            due_date="2026-01-06",
-            priority=2,
-            assigned_to="John",
-            meal_id="test_meal",
-            task_type="shopping",
-            subtasks=[subtask1, subtask2],
-        )
+        assert not hasattr(task, "__dict__")
+        with pytest.raises(AttributeError):
+            task.unknown_field = "value"
 
-        assert len(parent_task.subtasks) == 2
-        assert parent_task.subtasks[0].title == "Subtask 1"
-        assert parent_task.subtasks[1].title == "Subtask 2"
-
-    def test_task_with_labels(self):
-        """Test Task with labels."""
-        task = Task(
-            title="Test Task",
-            description="",
-            due_date="2026-01-06",
-            priority=2,
-            assigned_to="John",
-            meal_id="test_meal",
-            task_type="shopping",
-            labels=["produce", "urgent"],
-        )
+    def test_task_defaults_do_not_allocate(self):
+        """Test tasks without labels or subtasks share an immutable empty default."""
+        task1 = Task(title="Task 1", description="", priority=4, assigned_to="")
+        task2 = Task(title="Task 2", description="", priority=4, assigned_to="")
 
-        assert len(task.labels) == 2
-        assert "produce" in task.labels
-        assert "urgent" in task.labels
+        assert task1.labels == () and task1.subtasks == ()
+        assert task1.labels is task2.labels
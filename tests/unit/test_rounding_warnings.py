@@ -0,0 +1,72 @@
+"""
+Unit tests for rounding warnings module.
+"""
+
+import pytest
+
+from recipier.rounding_warnings import (
+    _combined_increase,
+    _meal_additional_portions,
+    generate_rounding_warning,
+    needs_rounding_warning,
+)
+
+
+@pytest.mark.unit
+class TestRoundingWarnings:
+    """Tests for rounding warning generation and its suggestion searches."""
+
+    def test_meal_additional_portions(self):
+        """Test the smallest extra portion count that lands within 30% of whole units."""
+        # 2 portions of 100g with 500g units: 400g (2 extra portions) is the first within 30% of 500g
+        assert _meal_additional_portions(2, 100, 500) == 2
+        # Already large totals are always within 30%, so one extra portion is enough
+        assert _meal_additional_portions(10, 100, 200) == 1
+        # Even 9 extra portions of 1g stay far below a 1000g unit
+        assert _meal_additional_portions(1, 1, 1000) == 0
+
+    def test_combined_increase(self):
+        """Test the smallest extra portion count per meal that lands within 50% of whole units."""
+        meals = [
+            {"current_portions": 1, "qty_per_portion": 50},
+            {"current_portions": 1, "qty_per_portion": 50},
+        ]
+        # 100g now; 2 extra portions each makes 300g, the first total >= 2/3 of a 400g unit
+        assert _combined_increase(meals, 400) == 2
+        assert _combined_increase(meals, 100000) == 0
+
+    def test_needs_rounding_warning(self):
+        """Test the pre-check flags exactly the changes above 50%."""
+        assert needs_rounding_warning(100, 151)
+        assert not needs_rounding_warning(100, 150)
+        assert not needs_rounding_warning(0, 500)
+
+    def test_generate_rounding_warning(self):
+        """Test warnings are only produced for changes above 50%, with per-meal suggestions."""
+        meal_plan = {
+            "meals": [
+                {
+                    "name": "Omelette",
+                    "ingredients": [{"name": "eggs", "quantity": 100}],
+                    "eating_dates_per_person": {"John": ["2026-01-06"], "Jane": ["2026-01-06"]},
+                },
+                {
+                    "name": "Salad",
+                    "ingredients": [{"name": "lettuce", "quantity": 200}],
+                    "eating_dates_per_person": {"John": ["2026-01-07"]},
+                },
+            ]
+        }
+
+        assert generate_rounding_warning("eggs", 100, 120, 60, meal_plan) is None
+
+        warning = generate_rounding_warning("eggs", 100, 200, 200, meal_plan)
+
+        assert warning["percent_change"] == 1.0
+        assert warning["meals"] == [
+            {"meal_name": "Omelette", "current_portions": 2, "suggested_additional_portions": 2}
+        ]
+        assert warning["combined_increase"] == 0  # Only one meal uses eggs
+
+        # Suggestions above 5 extra portions are dropped as impractical
+        assert generate_rounding_warning("eggs", 100, 500, 500, meal_plan)["meals"] == []